@@ -62,11 +62,59 @@ a total of |E| elements, one element per directed edge.
 # https://stackoverflow.com/questions/2218322/what-is-better-adjacency-lists-or-adjacency-matrices-for-graph-problems-in-c
 # https://en.wikipedia.org/wiki/Adjacency_list
 # http://www.mathcs.emory.edu/~cheung/Courses/171/Syllabus/11-Graph/weighted.html
+import heapq
+import random
+from array import array
+from collections import deque
+from multiprocessing import Pool
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def _brandes_accumulate(csr):
+    """
+    Brandes' dependency accumulation for the given sources over a CSR 
+    graph. Kept at module level so that it can be shipped to worker 
+    processes. Returns the partial (unnormalized) betweenness of every 
+    vertex id, counting each unordered pair of vertices twice.
+    """
+    indptr, indices, sources = csr
+    n = len(indptr) - 1
+    centrality = [0.0] * n
+    for s in sources:
+        # Single-source shortest paths with BFS, counting shortest paths
+        order, predecessors = [], [[] for _ in range(n)]
+        sigma, dist = [0] * n, [-1] * n
+        sigma[s], dist[s] = 1, 0
+        q = deque([s])
+        while q:
+            v = q.popleft()
+            order.append(v)
+            for i in range(indptr[v], indptr[v + 1]):
+                w = indices[i]
+                if dist[w] < 0:
+                    dist[w] = dist[v] + 1
+                    q.append(w)
+                if dist[w] == dist[v] + 1:
+                    sigma[w] += sigma[v]
+                    predecessors[w].append(v)
+        # Accumulate dependencies in order of non-increasing distance from s
+        delta = [0.0] * n
+        while order:
+            w = order.pop()
+            for v in predecessors[w]:
+                delta[v] += sigma[v] / sigma[w] * (1 + delta[w])
+            if w != s:
+                centrality[w] += delta[w]
+    return centrality
+
 class AdjacencyListGraph:
     """Class representing simple undirected unweighted/weighted graphs using adjacency list"""
     def __init__(self):
-        """Initializes adjacency list"""
+        """Initializes adjacency list and the append-only log of mutations"""
         self.__adjacencylist = {}
+        self.__changelog = []
     
     def vertices(self):
         """Method to return all the vertices in the graph as an iterable"""
@@ -103,6 +151,7 @@ class AdjacencyListGraph:
             raise ValueError('Vertex already in graph!')
         else:
             self.__adjacencylist[v] = set()
+            self.__changelog.append(('add_vertex', (v,)))
 
     def add_edge(self, s, d, w = 0):
         """Method to add edge between two vertices in graph"""
@@ -119,6 +168,7 @@ class AdjacencyListGraph:
             self.__adjacencylist[s].add((d, w))
             # Adding edge from destination to source with weight w
             self.__adjacencylist[d].add((s, w))
+            self.__changelog.append(('add_edge', (s, d, w)))
 
     def remove_edge(self, s, d, w = 0):
         """Method to remove edge between two vertices in graph"""
@@ -131,6 +181,7 @@ class AdjacencyListGraph:
             self.__adjacencylist[s].remove((d, w))
             # Remove edge from destination to source with weight w
             self.__adjacencylist[d].remove((s, w))
+            self.__changelog.append(('remove_edge', (s, d, w)))
     
     def remove_vertex(self, v):
         """Method to remove vertex and its associated edges from graph"""
@@ -144,4 +195,488 @@ class AdjacencyListGraph:
                 self.remove_edge(v, u, w)
             edges_to_remove.clear()
             # Deleting v from adjacency list
-            del self.__adjacencylist[v]
\ No newline at end of file
+            del self.__adjacencylist[v]
+            self.__changelog.append(('remove_vertex', (v,)))
+
+    def version(self):
+        """Method to return the version of the graph i.e. the number of mutations applied to it"""
+        return len(self.__changelog)
+
+    def diff(self, since_version = 0):
+        """
+        Method to return the mutations applied after the given version 
+        as a list of (operation, arguments) tuples in the order they were 
+        applied. Operations are 'add_vertex', 'add_edge', 'remove_edge' 
+        and 'remove_vertex', and a vertex removal is preceded by the 
+        removals of its edges. Replicas that were at since_version catch 
+        up by passing the diff to apply rather than rebuilding.
+        """
+        if not 0 <= since_version <= len(self.__changelog):
+            raise ValueError('Version not in change log!')
+        return self.__changelog[since_version:]
+
+    def apply(self, changes):
+        """Method to apply (operation, arguments) tuples, as returned by diff, to the graph"""
+        operations = {
+            'add_vertex': self.add_vertex,
+            'add_edge': self.add_edge,
+            'remove_edge': self.remove_edge,
+            'remove_vertex': self.remove_vertex
+        }
+        for operation, arguments in changes:
+            if operation not in operations:
+                raise ValueError('Unknown operation in change log!')
+            operations[operation](*arguments)
+
+    @classmethod
+    def replay(cls, changes):
+        """Method to build a new graph by applying the given changes to an empty graph"""
+        graph = cls()
+        graph.apply(changes)
+        return graph
+
+    def adjacent_vertices(self, v):
+        """Method to return a list of all adjacent vertices to v in graph"""
+        if not self.has_vertex(v):
+            raise ValueError('Vertex not in graph!')
+        else:
+            return [u for u, w in self.__adjacencylist[v]]
+
+    def degree(self, v):
+        """Method to return degree of vertex"""
+        if not self.has_vertex(v):
+            raise ValueError('Vertex not in graph!')
+        else:
+            return len(self.__adjacencylist[v])
+
+    def get_degree_sequence(self):
+        """Method to return the degree sequence of the graph in non-decreasing order"""
+        return sorted(len(edges) for edges in self.__adjacencylist.values())
+
+    def to_csr(self):
+        """
+        Method to export the graph in compressed sparse row (CSR) form. 
+        Vertex i is vertices[i], and its neighbours are the ids 
+        indices[indptr[i]:indptr[i + 1]] with the matching edge weights 
+        in weights. Flat typed arrays take a fraction of the memory of 
+        the adjacency sets and can be scanned without Python objects.
+
+        Returns:
+            vertices: List mapping vertex id to vertex
+            indptr: array of length |V| + 1 with the start of each vertex's neighbours
+            indices: array of length 2|E| with neighbour ids
+            weights: array of length 2|E| with edge weights
+        """
+        vertices = list(self.__adjacencylist)
+        ids = {v: i for i, v in enumerate(vertices)}
+        indptr, indices, weights = array('q', [0]), array('q'), array('d')
+        for v in vertices:
+            for u, w in self.__adjacencylist[v]:
+                indices.append(ids[u])
+                weights.append(w)
+            indptr.append(len(indices))
+        return vertices, indptr, indices, weights
+
+    def degree_centrality(self):
+        """Method to return the degree of each vertex divided by the largest possible degree |V| - 1"""
+        n = self.order()
+        scale = 1 / (n - 1) if n > 1 else 0
+        return {v: self.degree(v) * scale for v in self.__adjacencylist}
+
+    def pagerank(self, damping = 0.85, tolerance = 1e-6, max_iterations = 100):
+        """
+        Method to compute the PageRank of every vertex by power iteration
+        on the CSR export, treating each undirected edge as a link in both
+        directions. The rank of vertices without edges is spread evenly
+        over all vertices. Iteration stops when the L1 change between two
+        iterations drops below tolerance. NumPy is used for the sparse
+        matrix-vector products when it is installed.
+
+        Params:
+            damping(float): Probability of following a link rather than jumping to a random vertex
+            tolerance(float): L1 convergence tolerance
+            max_iterations(int): Upper bound on the number of power iterations
+
+        Returns:
+            Dictionary of PageRank of each vertex, summing to 1
+        """
+        vertices, indptr, indices, weights = self.to_csr()
+        n = len(vertices)
+        if n == 0:
+            return {}
+        if np is not None:
+            ranks = self.__pagerank_numpy(indptr, indices, damping, tolerance, max_iterations)
+        else:
+            ranks = self.__pagerank_python(indptr, indices, damping, tolerance, max_iterations)
+        return dict(zip(vertices, ranks))
+
+    def __pagerank_numpy(self, indptr, indices, damping, tolerance, max_iterations):
+        """Helper method for PageRank power iteration with NumPy arrays"""
+        indptr, indices = np.frombuffer(indptr, dtype=np.int64), np.frombuffer(indices, dtype=np.int64)
+        n = len(indptr) - 1
+        degrees = np.diff(indptr)
+        # rows[i] is the vertex whose neighbour list holds indices[i]
+        rows = np.repeat(np.arange(n), degrees)
+        dangling = degrees == 0
+        inverse_degrees = np.divide(1.0, degrees, out=np.zeros(n), where=~dangling)
+        ranks = np.full(n, 1.0 / n)
+        for _ in range(max_iterations):
+            shares = ranks * inverse_degrees
+            new_ranks = damping * np.bincount(rows, weights=shares[indices], minlength=n)
+            new_ranks += (1.0 - damping + damping * ranks[dangling].sum()) / n
+            change = np.abs(new_ranks - ranks).sum()
+            ranks = new_ranks
+            if change < tolerance:
+                break
+        return ranks.tolist()
+
+    def __pagerank_python(self, indptr, indices, damping, tolerance, max_iterations):
+        """Helper method for PageRank power iteration without NumPy"""
+        n = len(indptr) - 1
+        ranks = [1.0 / n] * n
+        for _ in range(max_iterations):
+            dangling_rank = sum(ranks[v] for v in range(n) if indptr[v] == indptr[v + 1])
+            base = (1.0 - damping + damping * dangling_rank) / n
+            shares = [ranks[v] / (indptr[v + 1] - indptr[v]) if indptr[v + 1] > indptr[v] else 0.0 for v in range(n)]
+            new_ranks = [base + damping * sum(shares[indices[i]] for i in range(indptr[v], indptr[v + 1])) for v in range(n)]
+            change = sum(abs(a - b) for a, b in zip(new_ranks, ranks))
+            ranks = new_ranks
+            if change < tolerance:
+                break
+        return ranks
+
+    def betweenness_centrality(self, samples = None, normalized = True, processes = None, seed = None):
+        """
+        Method to compute the betweenness centrality of every vertex with
+        Brandes' algorithm in O(VE) on the CSR export. Path lengths are 
+        measured in number of edges.
+
+        Params:
+            samples(int): If given, only this many randomly chosen sources are
+            used and the result is scaled up, trading accuracy for speed
+            normalized(bool): Divide by the number of pairs of other vertices (|V| - 1)(|V| - 2) / 2
+            processes(int): If given, the sources are split across this many worker processes
+            seed: Seed for choosing the sampled sources
+
+        Returns:
+            Dictionary of betweenness centrality of each vertex
+        """
+        vertices, indptr, indices, weights = self.to_csr()
+        n = len(vertices)
+        sources = list(range(n))
+        if samples is not None and samples < n:
+            sources = random.Random(seed).sample(sources, samples)
+        if processes is None or processes <= 1 or len(sources) < 2:
+            centrality = _brandes_accumulate((indptr, indices, sources))
+        else:
+            chunks = [(indptr, indices, sources[i::processes]) for i in range(processes)]
+            centrality = [0.0] * n
+            with Pool(processes) as pool:
+                for partial in pool.map(_brandes_accumulate, chunks):
+                    for v in range(n):
+                        centrality[v] += partial[v]
+        # Each unordered pair was counted from both endpoints
+        scale = 0.5 * n / len(sources) if sources else 0
+        if normalized:
+            scale = scale * 2 / ((n - 1) * (n - 2)) if n > 2 else 0
+        return {v: centrality[i] * scale for i, v in enumerate(vertices)}
+
+    def multi_source_bfs(self, sources):
+        """
+        Method to compute the number of edges from each vertex to its 
+        nearest source by seeding the BFS queue with every source.
+
+        Returns:
+            distances: Dictionary of distance from each vertex to its nearest source, -1 if unreachable
+            nearest: Dictionary of nearest source of each vertex, None if unreachable
+        """
+        distances = {u: -1 for u in self.__adjacencylist}
+        nearest = {u: None for u in self.__adjacencylist}
+        q = deque()
+        for source in sources:
+            if not self.has_vertex(source):
+                raise ValueError('Vertex not in graph!')
+            if distances[source] == -1:
+                distances[source], nearest[source] = 0, source
+                q.append(source)
+        while q:
+            current = q.popleft()
+            for neighbour, w in self.__adjacencylist[current]:
+                if distances[neighbour] == -1:
+                    distances[neighbour] = distances[current] + 1
+                    nearest[neighbour] = nearest[current]
+                    q.append(neighbour)
+        return distances, nearest
+
+    def multi_source_dijkstra(self, sources, heap = None):
+        """
+        Method to run Dijkstra's algorithm from several sources at once.
+        Seeding the priority queue with every source at distance 0 grows
+        all shortest-path trees together, so each vertex is settled by
+        its nearest source in a single O((V + E)log(V)) run instead of 
+        one run per source. The priority queue can be chosen with heap,
+        see __dijkstra.
+
+        Returns:
+            distances: Dictionary of distance from each vertex to its nearest source, inf if unreachable
+            nearest: Dictionary of nearest source of each vertex, None if unreachable
+        """
+        settled, nearest = self.__dijkstra(sources, heap=heap)
+        distances = {u: settled.get(u, float('inf')) for u in self.__adjacencylist}
+        return distances, {u: nearest.get(u) for u in self.__adjacencylist}
+
+    def distances(self, pairs, heap = None):
+        """
+        Method to answer a batch of shortest-path distance queries.
+        Pairs are grouped by source so that each source runs Dijkstra's
+        algorithm once, and that run stops as soon as every destination
+        asked for from that source has been settled. The priority 
+        queue can be chosen with heap, see __dijkstra.
+
+        Returns:
+            List of shortest-path distances in the same order as pairs, inf if unreachable
+        """
+        by_source, count = {}, 0
+        for source, destination in pairs:
+            if not self.has_vertex(destination):
+                raise ValueError('Vertex not in graph!')
+            by_source.setdefault(source, []).append((count, destination))
+            count += 1
+        result = [None] * count
+        for source, queries in by_source.items():
+            settled, _ = self.__dijkstra([source], {d for i, d in queries}, heap)
+            for i, destination in queries:
+                result[i] = settled.get(destination, float('inf'))
+        return result
+
+    def __dijkstra(self, sources, targets = None, heap = None):
+        """
+        Helper method for Dijkstra's algorithm from one or more sources. 
+        Only vertices that are reached are stored so that early exit on
+        targets does not cost O(V) per call.
+
+        By default the priority queue is a heapq list of (distance, 
+        vertex) pairs. Any class with the MinHeap API (MinHeap, DaryHeap,
+        PairingHeap, or RadixHeap when the weights are non-negative 
+        integers) can be passed as heap instead. It is called as 
+        heap(key=...) and holds vertices keyed by their distance when
+        inserted. In both cases a vertex is inserted again when a 
+        shorter path to it is found, and entries for vertices that are
+        already settled are skipped.
+        """
+        distances, nearest, visited = {}, {}, set()
+        q = [] if heap is None else heap(key=distances.__getitem__)
+        for source in sources:
+            if not self.has_vertex(source):
+                raise ValueError('Vertex not in graph!')
+            distances[source], nearest[source] = 0, source
+            if heap is None:
+                q.append((0, source))
+            else:
+                q.insert(source)
+        if heap is None:
+            heapq.heapify(q)
+        remaining = set(targets) if targets is not None else None
+        while (q if heap is None else not q.is_empty()):
+            if heap is None:
+                distance, u = heapq.heappop(q)
+            else:
+                u = q.poll()
+                distance = distances[u]
+            if u in visited:
+                continue
+            visited.add(u)
+            if remaining is not None:
+                remaining.discard(u)
+                if not remaining:
+                    break
+            for neighbour, w in self.__adjacencylist[u]:
+                new_distance = distance + w
+                if neighbour not in visited and new_distance < distances.get(neighbour, float('inf')):
+                    distances[neighbour], nearest[neighbour] = new_distance, nearest[u]
+                    if heap is None:
+                        heapq.heappush(q, (new_distance, neighbour))
+                    else:
+                        q.insert(neighbour)
+        return distances, nearest
+
+    def induced_subgraph(self, vertices):
+        """
+        Method to return the subgraph induced by the given vertices 
+        i.e. those vertices together with every edge of the graph 
+        whose endpoints are both in the set. The subgraph is built 
+        directly from the adjacency list in O(sum of degrees) rather 
+        than by copying the graph and deleting what is not needed.
+        Its change log records the vertices and edges added, so it 
+        can be replicated with replay like any other graph.
+        """
+        vertices = set(vertices)
+        for v in vertices:
+            if not self.has_vertex(v):
+                raise ValueError('Vertex not in graph!')
+        subgraph, added = AdjacencyListGraph(), set()
+        for v in vertices:
+            subgraph.__adjacencylist[v] = {(u, w) for u, w in self.__adjacencylist[v] if u in vertices}
+            subgraph.__changelog.append(('add_vertex', (v,)))
+        for v in vertices:
+            # log each edge once, from the endpoint visited first
+            for u, w in subgraph.__adjacencylist[v]:
+                if u not in added:
+                    subgraph.__changelog.append(('add_edge', (v, u, w)))
+            added.add(v)
+        return subgraph
+
+    def cut_size(self, parts):
+        """Method to return the number of edges whose endpoints lie in different parts"""
+        part_of = {v: i for i, part in enumerate(parts) for v in part}
+        return sum(1 for v in part_of for u, w in self.__adjacencylist[v] if part_of[u] != part_of[v]) // 2
+
+    def partition(self, k, passes = 4):
+        """
+        Method to split the vertices of the graph into k balanced parts
+        while keeping the number of cut edges small. Part sizes differ
+        by at most one vertex.
+
+        1. Grow each part as a BFS region from a seed vertex that lies
+        on the periphery of the vertices not yet assigned, so regions 
+        are compact and do not strand small pockets between them.
+        2. Refine every pair of neighbouring parts with Kernighan-Lin 
+        passes, which swap pairs of vertices across the cut for as 
+        long as a sequence of swaps reduces the number of cut edges.
+
+        Params:
+            k(int): The number of parts
+            passes(int): Maximum number of Kernighan-Lin passes per pair of parts
+
+        Returns:
+            parts: List of k sets of vertices
+        """
+        if k < 1:
+            raise ValueError('Number of parts must be positive!')
+        neighbours = {v: {u for u, w in self.__adjacencylist[v]} for v in self.__adjacencylist}
+        parts = self.__grow_regions(k, neighbours)
+        part_of = {v: i for i, part in enumerate(parts) for v in part}
+        for a in range(k):
+            for b in range(a + 1, k):
+                for _ in range(passes):
+                    if not self.__kernighan_lin(parts, part_of, a, b, neighbours):
+                        break
+        return parts
+
+    def partition_subgraphs(self, k, passes = 4):
+        """
+        Method to partition the graph into k parts and return each part
+        as an induced subgraph together with its boundary metadata, 
+        ready to be handed to a worker process.
+
+        Returns:
+            List of (subgraph, boundary) tuples where boundary maps each 
+            vertex of the part that has edges leaving the part to a list 
+            of (neighbour, weight, part index) tuples for those edges.
+        """
+        parts = self.partition(k, passes)
+        part_of = {v: i for i, part in enumerate(parts) for v in part}
+        result = []
+        for i, part in enumerate(parts):
+            boundary = {}
+            for v in part:
+                external = [(u, w, part_of[u]) for u, w in self.__adjacencylist[v] if part_of[u] != i]
+                if external:
+                    boundary[v] = external
+            result.append((self.induced_subgraph(part), boundary))
+        return result
+
+    def __grow_regions(self, k, neighbours):
+        """Helper method to assign vertices to k balanced BFS-grown regions"""
+        n = len(self.__adjacencylist)
+        unassigned = set(self.__adjacencylist)
+        parts = []
+        for i in range(k):
+            target = n // k + (1 if i < n % k else 0)
+            part, q = set(), deque()
+            while len(part) < target:
+                if not q:
+                    # Start (or restart, if the graph is disconnected) from a peripheral vertex
+                    seed = self.__peripheral_vertex(next(iter(unassigned)), unassigned, neighbours)
+                    unassigned.remove(seed)
+                    part.add(seed)
+                    q.append(seed)
+                    continue
+                current = q.popleft()
+                for u in neighbours[current]:
+                    if u in unassigned and len(part) < target:
+                        unassigned.remove(u)
+                        part.add(u)
+                        q.append(u)
+            parts.append(part)
+        return parts
+
+    def __peripheral_vertex(self, source, allowed, neighbours):
+        """Helper method to return the last vertex reached by a BFS from source within allowed vertices"""
+        visited, q, last = {source}, deque([source]), source
+        while q:
+            last = q.popleft()
+            for u in neighbours[last]:
+                if u in allowed and u not in visited:
+                    visited.add(u)
+                    q.append(u)
+        return last
+
+    def __kernighan_lin(self, parts, part_of, a, b, neighbours):
+        """
+        Helper method to perform one Kernighan-Lin pass between parts a and b.
+        D(v) is the number of neighbours of v across the cut minus the number
+        of neighbours on its own side, so swapping x in a with y in b gains
+        D(x) + D(y) - 2c(x, y). Only vertices on the a-b boundary at the start
+        of the pass are candidates, which keeps a pass proportional to the 
+        boundary rather than to the parts. Returns True if the cut improved.
+        """
+        side, D, candidates_a, candidates_b = {}, {}, set(), set()
+        for v in parts[a] | parts[b]:
+            own = part_of[v]
+            other = b if own == a else a
+            internal = external = 0
+            for u in neighbours[v]:
+                if part_of[u] == own:
+                    internal += 1
+                elif part_of[u] == other:
+                    external += 1
+            side[v], D[v] = own, external - internal
+            if external:
+                (candidates_a if own == a else candidates_b).add(v)
+        locked, swaps, gains = set(), [], []
+        for _ in range(min(len(candidates_a), len(candidates_b))):
+            best, best_gain = None, None
+            order_b = sorted((v for v in candidates_b if v not in locked), key=D.get, reverse=True)
+            for x in sorted((v for v in candidates_a if v not in locked), key=D.get, reverse=True):
+                if best_gain is not None and D[x] + D[order_b[0]] <= best_gain:
+                    break
+                for y in order_b:
+                    if best_gain is not None and D[x] + D[y] <= best_gain:
+                        break
+                    gain = D[x] + D[y] - (2 if y in neighbours[x] else 0)
+                    if best_gain is None or gain > best_gain:
+                        best, best_gain = (x, y), gain
+            x, y = best
+            locked.update(best)
+            swaps.append(best)
+            gains.append(best_gain)
+            # Tentatively swap x and y and update D for their unlocked neighbours
+            side[x], side[y] = b, a
+            for moved, old in ((x, a), (y, b)):
+                for u in neighbours[moved]:
+                    if u in side and u not in locked:
+                        D[u] += 2 if side[u] == old else -2
+        # Keep the prefix of swaps with the largest cumulative gain
+        best_k, best_total, total = 0, 0, 0
+        for i, gain in enumerate(gains):
+            total += gain
+            if total > best_total:
+                best_k, best_total = i + 1, total
+        for x, y in swaps[:best_k]:
+            parts[a].remove(x)
+            parts[b].remove(y)
+            parts[a].add(y)
+            parts[b].add(x)
+            part_of[x], part_of[y] = b, a
+        return best_k > 0
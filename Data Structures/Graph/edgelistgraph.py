@@ -1,7 +1,8 @@
-import heapq
 import sys
+from collections import deque
 sys.path.insert(1, '../')
 from Set.disjointset import DisjointSet
+from Tree.IndexedHeap import IndexedMinHeap
 """
 Simple Graph: A graph with no self loops or parallel edges.
 
@@ -62,9 +63,10 @@ https://www.khanacademy.org/computing/computer-science/algorithms/graph-represen
 class EdgeListGraph:
     """Class representing simple undirected weighted/unweighted graphs using edge list"""
     def __init__(self):
-        """Initialize vertices and edges objects"""
+        """Initialize vertices and edges objects and the append-only log of mutations"""
         self.__vertices = set()
         self.__edges = set()
+        self.__changelog = []
 
     def vertices(self):
         """Method to return all the vertices in the graph as an iterable"""
@@ -81,6 +83,7 @@ class EdgeListGraph:
             raise ValueError('Vertex already in graph!')
         else:
             self.__vertices.add(v)
+            self.__changelog.append(('add_vertex', (v,)))
     
     def addEdge(self, s, d, w = 0):
         """Method to add edge between two vertices in graph"""
@@ -101,6 +104,7 @@ class EdgeListGraph:
             raise ValueError('No self loops in graph!')
         else:
             self.__edges.add((s, d, w))
+            self.__changelog.append(('add_edge', (s, d, w)))
 
     def removeEdge(self, s, d, w = 0):
         """Method to remove edge between two vertices in graph"""
@@ -114,8 +118,10 @@ class EdgeListGraph:
             raise ValueError('Destination vertex not in the graph!')
         elif self.hasEdge(s, d, w):
             self.__edges.remove((s, d, w))
+            self.__changelog.append(('remove_edge', (s, d, w)))
         elif self.hasEdge(d, s, w):
             self.__edges.remove((d, s, w))
+            self.__changelog.append(('remove_edge', (d, s, w)))
             
     def removeVertex(self, v):
         """Method to remove vertex and its associated edges from graph"""
@@ -136,6 +142,44 @@ class EdgeListGraph:
             edges_to_remove.clear()
             # Remove v from graph 
             self.__vertices.remove(v)
+            self.__changelog.append(('remove_vertex', (v,)))
+
+    def version(self):
+        """Method to return the version of the graph i.e. the number of mutations applied to it"""
+        return len(self.__changelog)
+
+    def diff(self, since_version = 0):
+        """
+        Method to return the mutations applied after the given version 
+        as a list of (operation, arguments) tuples in the order they were 
+        applied. Operations are 'add_vertex', 'add_edge', 'remove_edge' 
+        and 'remove_vertex', and a vertex removal is preceded by the 
+        removals of its edges. Replicas that were at since_version catch 
+        up by passing the diff to apply rather than rebuilding.
+        """
+        if not 0 <= since_version <= len(self.__changelog):
+            raise ValueError('Version not in change log!')
+        return self.__changelog[since_version:]
+
+    def apply(self, changes):
+        """Method to apply (operation, arguments) tuples, as returned by diff, to the graph"""
+        operations = {
+            'add_vertex': self.addVertex,
+            'add_edge': self.addEdge,
+            'remove_edge': self.removeEdge,
+            'remove_vertex': self.removeVertex
+        }
+        for operation, arguments in changes:
+            if operation not in operations:
+                raise ValueError('Unknown operation in change log!')
+            operations[operation](*arguments)
+
+    @classmethod
+    def replay(cls, changes):
+        """Method to build a new graph by applying the given changes to an empty graph"""
+        graph = cls()
+        graph.apply(changes)
+        return graph
 
     def hasVertex(self, v):
         """Method to return boolean indicating if a vertex is in the graph"""
@@ -254,21 +298,47 @@ class EdgeListGraph:
             vertexLabels[u] = 'UNEXPLORED'
         for e in self.__edges:
             edgeLabels[e] = 'UNEXPLORED'
+        index = self.__incidenceIndex()
         for v in self.__vertices:
             if vertexLabels[v] == 'UNEXPLORED':
-                self.__dfs(v, vertexLabels, edgeLabels)
+                self.__dfs(v, vertexLabels, edgeLabels, index)
+
+    def __incidenceIndex(self):
+        """
+        Helper method to index the incident edges of every vertex in 
+        O(V + E) so that traversals do not rescan the edge list for 
+        each vertex they visit.
+        """
+        index = {v: [] for v in self.__vertices}
+        for e in self.__edges:
+            index[e[0]].append(e)
+            index[e[1]].append(e)
+        return index
 
-    def __dfs(self, vertex, vLabels, eLabels):
-        """Method to perform depth-first search starting from a given node in graph"""
+    def __dfs(self, vertex, vLabels, eLabels, index):
+        """
+        Method to perform depth-first search starting from a given node in graph.
+        An explicit stack of (vertex, incident edge iterator) pairs replaces the
+        call stack so that long paths do not hit the recursion limit.
+        """
         vLabels[vertex] = 'VISITED'
-        for e in self.incidentEdges(vertex):
-            if eLabels[e] == 'UNEXPLORED':
-                u = self.oppositeVertexOnEdge(vertex, e)
-                if vLabels[u] == 'UNEXPLORED':
-                    eLabels[e] = 'DISCOVERY'
-                    self.__dfs(u, vLabels, eLabels)
-                else:
-                    eLabels[e] = 'BACK'
+        stack = [(vertex, iter(index[vertex]))]
+        while stack:
+            current, incident = stack[-1]
+            for e in incident:
+                if eLabels[e] == 'UNEXPLORED':
+                    u = self.oppositeVertexOnEdge(current, e)
+                    if vLabels[u] == 'UNEXPLORED':
+                        eLabels[e] = 'DISCOVERY'
+                        vLabels[u] = 'VISITED'
+                        # Suspend current vertex and descend into u
+                        stack.append((u, iter(index[u])))
+                        break
+                    else:
+                        eLabels[e] = 'BACK'
+            else:
+                # Every incident edge explored so backtrack
+                stack.pop()
 
     def depthFirstPrint(self):
         """Method to print vertices of graph in dfs manner"""
@@ -293,22 +363,36 @@ class EdgeListGraph:
                     stack.append(neighbour)
 
     def depthFirstPrintRecursive(self):
-        """Method to print vertices in dfs manner recursively"""
+        """Method to print vertices in the order a recursive dfs visits them"""
         visited = {}
+        index = self.__incidenceIndex()
 
         for v in self.__vertices:
             visited[v] = False
         for v in self.__vertices:
             if not visited[v]:
-                self.__depthFirstPrintRecursive(v, visited)
+                self.__depthFirstPrintRecursive(v, visited, index)
     
-    def __depthFirstPrintRecursive(self, source, visited):
-        """Helper method to print vertices in graph in dfs manner recursively"""
+    def __depthFirstPrintRecursive(self, source, visited, index):
+        """
+        Helper method to print vertices in graph in recursive dfs order. 
+        The recursion is simulated with a stack of neighbour iterators 
+        so the visiting order is unchanged but the depth is unbounded.
+        """
         print(source)
         visited[source] = True
-        for neighbour in self.adjacentVertices(source):
-            if not visited[neighbour]:
-                self.__depthFirstPrintRecursive(neighbour, visited)
+        stack = [(source, iter(index[source]))]
+        while stack:
+            current, incident = stack[-1]
+            for e in incident:
+                neighbour = self.oppositeVertexOnEdge(current, e)
+                if not visited[neighbour]:
+                    print(neighbour)
+                    visited[neighbour] = True
+                    stack.append((neighbour, iter(index[neighbour])))
+                    break
+            else:
+                stack.pop()
 
     def bfs(self):
         """
@@ -454,9 +538,10 @@ class EdgeListGraph:
             vertexLabels[v] = 'UNEXPLORED'
         for e in self.__edges:
             edgeLabels[e] = 'UNEXPLORED'
+        index = self.__incidenceIndex()
         for v in self.__vertices:
             if vertexLabels[v] == 'UNEXPLORED':
-                self.__dfs(v, vertexLabels, edgeLabels)
+                self.__dfs(v, vertexLabels, edgeLabels, index)
                 count += 1
         return count
 
@@ -475,50 +560,67 @@ class EdgeListGraph:
         Path: A path is a walk with no repeated vertices. A path
         is always a trail since to repeat an edge you must repeat
         at least one vertex.
+
+        Returns:
+            path: Alternating list of vertices and edges from source to destination
+            None: If there is no such path between source and destination
         """
+        if not self.hasVertex(source) or not self.hasVertex(destination):
+            raise ValueError('Vertex not in graph!')
         vertexLabels, edgeLabels = {}, {}
         for v in self.__vertices:
             vertexLabels[v] = 'UNEXPLORED'
         for e in self.__edges:
             edgeLabels[e] = 'UNEXPLORED'
-        return self.__findPathDFS(source, destination, vertexLabels, edgeLabels)
+        return self.__findPathDFS(source, destination, vertexLabels, edgeLabels, self.__incidenceIndex())
 
-    def __findPathDFS(self, source, destination, vertexLabels, edgeLabels, stack = []):
+    def __findPathDFS(self, source, destination, vertexLabels, edgeLabels, index):
         """Helper method to find path from source to destination if it exists in graph using DFS"""
         vertexLabels[source] = 'VISITED' # Mark vertex as visited
-        stack.append(source) # Push vertex onto stack as it is on path
-    
-        if source == destination:
-            return stack
-
-        for e in self.incidentEdges(source):
-            if edgeLabels[e] == 'UNEXPLORED':
-                u = self.oppositeVertexOnEdge(source, e)
-                if vertexLabels[u] == 'UNEXPLORED':
-                    edgeLabels[e] = 'DISCOVERY'
-                    stack.append(e)
-                    partialpath = self.__findPathDFS(u, destination, vertexLabels, edgeLabels, stack)
-                    if partialpath:
-                        return partialpath
-                    stack.pop()
-                else:
-                    edgeLabels[e] = 'BACK'
-        stack.pop()
+        path = [source] # Vertices and edges on the current path
+        stack = [iter(index[source])] # Unexplored incident edges of each vertex on the path
 
-    def hasPathDFS(self, source, destination, visited = set()):
+        while stack:
+            current = path[-1]
+            if current == destination:
+                return path
+            for e in stack[-1]:
+                if edgeLabels[e] == 'UNEXPLORED':
+                    u = self.oppositeVertexOnEdge(current, e)
+                    if vertexLabels[u] == 'UNEXPLORED':
+                        edgeLabels[e] = 'DISCOVERY'
+                        vertexLabels[u] = 'VISITED'
+                        path.append(e)
+                        path.append(u)
+                        stack.append(iter(index[u]))
+                        break
+                    else:
+                        edgeLabels[e] = 'BACK'
+            else:
+                # Dead end so remove vertex and the edge that led to it from the path
+                stack.pop()
+                path.pop()
+                if path:
+                    path.pop()
+        return None
+
+    def hasPathDFS(self, source, destination):
         """Method to return boolean indicating if there is a path from source to destination in graph using DFS"""
-        # Base cases / stopping conditions
+        if not self.hasVertex(source) or not self.hasVertex(destination):
+            raise ValueError('Vertex not in graph!')
         if source == destination:
             return True
-        if source in visited:
-            return False
-        # Mark vertex as visited
-        visited.add(source)
-        # Iterate through neighours of source vertex
-        for neighbour in self.adjacentVertices(source):
-            # Inductive step: Do some work to shrink the problem space
-            if self.hasPathDFS(neighbour, destination, visited):
-                return True
+        index = self.__incidenceIndex()
+        visited, stack = {source}, [source]
+        while stack:
+            current = stack.pop()
+            for e in index[current]:
+                neighbour = self.oppositeVertexOnEdge(current, e)
+                if neighbour == destination:
+                    return True
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    stack.append(neighbour)
         return False
            
     def isCyclic(self):
@@ -529,56 +631,104 @@ class EdgeListGraph:
         the beginning and ending vertex). A cycle is a path
         that is also a circuit and a closed walk.
         """
-        visited = set()
-        for vertex in self.__vertices:
-            if vertex not in visited:
-                # Call recursive helper function to detect cycle in different DFS trees
-                if self.__isCyclic(vertex, visited):
-                    return True
-        return False
+        return self.findCycle() is not None
 
-    def __isCyclic(self, vertex, visited, parent = None):
-        """Helper Method to detect cycle in graph using DFS"""
-        visited.add(vertex) # Mark vertex as visited
-        # Recur for all the vertices adjacent to this vertex
-        for neighbour in self.adjacentVertices(vertex):
-            if neighbour not in visited:
-                if self.__isCyclic(neighbour, visited, vertex):
-                    return True
-            # If an adjacent vertex is visited and is not the
-            # parent of the current vertex then there is a cycle
-            elif parent != neighbour:
-                return True
-        return False
+    def findCycle(self):
+        """
+        Method to find a simple cycle in graph using DFS. In an 
+        undirected graph the first non-tree edge met by DFS is a 
+        back edge to an ancestor on the current path, so the cycle
+        is the slice of the path from that ancestor onwards.
+
+        Returns:
+            cycle: List of vertices [v0, ..., vk] where consecutive vertices and vk, v0 are adjacent
+            None: If the graph is acyclic
+        """
+        index = self.__incidenceIndex()
+        visited = set()
+        for root in self.__vertices:
+            if root in visited:
+                continue
+            visited.add(root)
+            # position[v] is the index of v in path while v is on the path
+            path, position = [root], {root: 0}
+            stack = [(root, None, iter(index[root]))]
+            while stack:
+                current, parent, incident = stack[-1]
+                for e in incident:
+                    neighbour = self.oppositeVertexOnEdge(current, e)
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        position[neighbour] = len(path)
+                        path.append(neighbour)
+                        stack.append((neighbour, current, iter(index[neighbour])))
+                        break
+                    # If an adjacent vertex is visited and is not the
+                    # parent of the current vertex then there is a cycle
+                    elif neighbour != parent:
+                        return path[position[neighbour]:]
+                else:
+                    stack.pop()
+                    del position[path.pop()]
+        return None
 
-    def isCutEdge(self, e):
-        """Method to check whether an edge is a cut-edge/bridge"""
+    def isCutEdge(self, e, index = None):
+        """
+        Method to check whether an edge is a cut-edge/bridge. The
+        components are counted on the incidence index while skipping
+        the edge, so the graph and its change log are not modified.
+        """
         if self.hasEdge(e[0], e[1], e[2]):
-            wG = self.countConnectedComponents()
-            self.removeEdge(e[0], e[1], e[2])
-            wGWithoutE = self.countConnectedComponents()
-            self.addEdge(e[0], e[1], e[2])
+            index = self.__incidenceIndex() if index is None else index
+            wG = self.__countComponents(index)
+            wGWithoutE = self.__countComponents(index, skipEdge=e)
             return wGWithoutE > wG
 
     def findAllCutEdges(self):
         """Method to find all cut edges in graph"""
-        return set(e for e in self.__edges if self.isCutEdge(e))
+        index = self.__incidenceIndex()
+        return set(e for e in self.__edges if self.isCutEdge(e, index))
 
-    def isCutVertex(self, v):
-        """Method to check if a vertex is a cut-vertex"""
+    def isCutVertex(self, v, index = None):
+        """
+        Method to check if a vertex is a cut-vertex. The components are
+        counted on the incidence index while skipping the vertex and its
+        edges, so the graph and its change log are not modified.
+        """
         if self.hasVertex(v):
-            wG = self.countConnectedComponents()
-            tmp = self.incidentEdges(v)
-            self.removeVertex(v)
-            wGWithoutV = self.countConnectedComponents()
-            self.addVertex(v)
-            for e in tmp:
-                self.addEdge(e[0], e[1], e[2])
+            index = self.__incidenceIndex() if index is None else index
+            wG = self.__countComponents(index)
+            wGWithoutV = self.__countComponents(index, skipVertex=v)
             return wGWithoutV > wG
 
     def findAllCutVertices(self):
         """Method to find all cut-vertices in graph"""
-        return set(v for v in self.__vertices if self.isCutVertex(v))
+        index = self.__incidenceIndex()
+        return set(v for v in self.__vertices if self.isCutVertex(v, index))
+
+    def __countComponents(self, index, skipVertex = None, skipEdge = None):
+        """
+        Helper method to count the connected components of the graph
+        without the vertex skipVertex and the edge skipEdge, using an
+        iterative DFS over the incidence index
+        """
+        visited, count = {skipVertex} if skipVertex is not None else set(), 0
+        for v in self.__vertices:
+            if v in visited:
+                continue
+            count += 1
+            visited.add(v)
+            stack = [v]
+            while stack:
+                current = stack.pop()
+                for e in index[current]:
+                    if e == skipEdge:
+                        continue
+                    neighbour = self.oppositeVertexOnEdge(current, e)
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        stack.append(neighbour)
+        return count
 
     def isTree(self):
         """Method to check if a graph is a tree"""
@@ -649,7 +799,7 @@ class EdgeListGraph:
                 ds.union(e[0], e[1])
         return min_cost
 
-    def primsAlgorithm(self):
+    def primsAlgorithm(self, heap = None):
         """
         Prim's algorithm (also known as Jarník's algorithm) 
         is a greedy algorithm that finds a minimum spanning 
@@ -667,10 +817,18 @@ class EdgeListGraph:
         the tree.
         3. Repeat step 2 (until all vertices are in the tree).
 
-        IMPORTANT POINT ON HEAPQ: According to the example 
-        from the documentation, you can use tuples, and it 
-        will sort by the first element of the tuple
-        https://stackoverflow.com/questions/3954530/how-to-make-heapq-evaluate-the-heap-off-of-a-specific-attribute
+        The priority queue is an IndexedMinHeap keyed by vertex, 
+        holding the cheapest known edge weight to each vertex 
+        outside the tree. A cheaper edge lowers that weight with
+        decrease_key, so the queue holds at most V entries rather 
+        than one per edge.
+
+        Params:
+            heap: Optional priority queue class with the MinHeap API, 
+            such as MinHeap, DaryHeap or PairingHeap, called as 
+            heap(key=...). It has no decrease_key, so a vertex is 
+            inserted again when a cheaper edge to it is found and 
+            the older entry is skipped when it comes out.
         """
         # Weight of minimum spanning tree
         min_weight = 0
@@ -678,24 +836,42 @@ class EdgeListGraph:
         visited = set()
         # Arbitrary vertex to begin growing mst cloud
         random_vertex = next(iter(self.__vertices))
+        # Cheapest known edge weight to each vertex outside the tree
+        best = {random_vertex: 0}
         # Heap-based priority queue to grow mst cloud
-        q = [(0, random_vertex)]
+        indexed = heap is None
+        q = IndexedMinHeap() if indexed else heap(key=best.__getitem__)
+        if indexed:
+            q.insert(random_vertex, 0)
+        else:
+            q.insert(random_vertex)
+        index = self.__incidenceIndex()
         # Growing minimum spanning tree cloud
-        while q:
-            weight, u = heapq.heappop(q)
-            if u in visited:
-                continue
+        while not q.is_empty():
+            if indexed:
+                u, weight = q.poll()
             else:
-                min_weight += weight
-                visited.add(u)
-                for e in self.incidentEdges(u):
-                    neighbour = self.oppositeVertexOnEdge(u, e)
-                    neighbour_weight = e[2]
-                    if neighbour not in visited:
-                        heapq.heappush(q, (neighbour_weight, neighbour))
+                u = q.poll()
+                if u in visited:
+                    continue
+                weight = best[u]
+            min_weight += weight
+            visited.add(u)
+            for e in index[u]:
+                neighbour = self.oppositeVertexOnEdge(u, e)
+                neighbour_weight = e[2]
+                if neighbour in visited or neighbour_weight >= best.get(neighbour, float('inf')):
+                    continue
+                best[neighbour] = neighbour_weight
+                if not indexed:
+                    q.insert(neighbour)
+                elif neighbour in q:
+                    q.decrease_key(neighbour, neighbour_weight)
+                else:
+                    q.insert(neighbour, neighbour_weight)
         return min_weight
 
-    def dijkstrasAlgorithm(self, source):
+    def dijkstrasAlgorithm(self, source, heap = None):
         """
         Dijkstra's algorithm is an algorithm for finding 
         the shortest paths between nodes in a weighted
@@ -713,35 +889,143 @@ class EdgeListGraph:
         a variant of it is known as uniform cost search and 
         formulated as an instance of the more general idea 
         of best-first search.
+
+        The priority queue can be chosen with heap, see __dijkstra.
         """    
-        # Visited set to keep track of vertices already seen
-        visited = set()
+        return self.multiSourceDijkstra([source], heap)[0]
+
+    def multiSourceDijkstra(self, sources, heap = None):
+        """
+        Method to run Dijkstra's algorithm from several sources at once.
+        Seeding the priority queue with every source at distance 0 grows
+        all shortest-path trees together, so each vertex is settled by
+        its nearest source in a single O((V + E)log(V)) run instead of 
+        one run per source.
+
+        Params:
+            sources(iterable): The source vertices e.g. facilities
+            heap: Optional priority queue class, see __dijkstra
+
+        Returns:
+            distances: Dictionary of distance from each vertex to its nearest source, inf if unreachable
+            nearest: Dictionary of nearest source of each vertex, None if unreachable
+        """
+        settled, nearest = self.__dijkstra(sources, self.__incidenceIndex(), heap=heap)
+        distances = {u: settled.get(u, float('inf')) for u in self.__vertices}
+        return distances, {u: nearest.get(u) for u in self.__vertices}
+
+    def multiSourceBFS(self, sources):
+        """
+        Method to compute the number of edges from each vertex to its 
+        nearest source by seeding the BFS queue with every source.
+
+        Returns:
+            distances: Dictionary of distance from each vertex to its nearest source, -1 if unreachable
+            nearest: Dictionary of nearest source of each vertex, None if unreachable
+        """
+        index = self.__incidenceIndex()
+        distances = {u: -1 for u in self.__vertices}
+        nearest = {u: None for u in self.__vertices}
+        q = deque()
+        for source in sources:
+            if not self.hasVertex(source):
+                raise ValueError('Vertex not in graph!')
+            if distances[source] == -1:
+                distances[source], nearest[source] = 0, source
+                q.append(source)
+        while q:
+            current = q.popleft()
+            for e in index[current]:
+                neighbour = self.oppositeVertexOnEdge(current, e)
+                if distances[neighbour] == -1:
+                    distances[neighbour] = distances[current] + 1
+                    nearest[neighbour] = nearest[current]
+                    q.append(neighbour)
+        return distances, nearest
+
+    def distances(self, pairs, heap = None):
+        """
+        Method to answer a batch of shortest-path distance queries.
+        Pairs are grouped by source so that each source runs Dijkstra's
+        algorithm once, and that run stops as soon as every destination
+        asked for from that source has been settled.
+
+        Params:
+            pairs(iterable): (source, destination) tuples
+            heap: Optional priority queue class, see __dijkstra
+
+        Returns:
+            List of shortest-path distances in the same order as pairs, inf if unreachable
+        """
+        by_source, count = {}, 0
+        for source, destination in pairs:
+            if not self.hasVertex(destination):
+                raise ValueError('Vertex not in graph!')
+            by_source.setdefault(source, []).append((count, destination))
+            count += 1
+        result, index = [None] * count, self.__incidenceIndex()
+        for source, queries in by_source.items():
+            settled, _ = self.__dijkstra([source], index, {d for i, d in queries}, heap)
+            for i, destination in queries:
+                result[i] = settled.get(destination, float('inf'))
+        return result
+
+    def __dijkstra(self, sources, index, targets = None, heap = None):
+        """
+        Helper method for Dijkstra's algorithm from one or more sources. 
+        Only vertices that are reached are stored so that early exit on
+        targets does not cost O(V) per call. By default the priority 
+        queue is an IndexedMinHeap, which holds each vertex at most 
+        once, and a shorter path lowers its distance with decrease_key 
+        instead of adding a stale entry.
+
+        Any class with the MinHeap API (MinHeap, DaryHeap, PairingHeap, 
+        or RadixHeap when the weights are non-negative integers) can be 
+        passed as heap instead. It is called as heap(key=...) and holds 
+        vertices keyed by their distance when inserted. A vertex is 
+        inserted again when a shorter path to it is found, and entries 
+        for vertices that are already settled are skipped.
+        """
         # Heap-based priority queue to store and query partial solutions
-        q = []
-        # Create distances dictionary
-        distances = {}
-        # Set tentative distances for all vertices
-        for u in self.__vertices:
-            if u == source:
-                distances[u] = 0
-                q.append([0, source])
-            else:
-                distances[u] = float('inf')
+        distances, nearest, visited = {}, {}, set()
+        indexed = heap is None
+        q = IndexedMinHeap() if indexed else heap(key=distances.__getitem__)
+        for source in sources:
+            if not self.hasVertex(source):
+                raise ValueError('Vertex not in graph!')
+            if source not in distances:
+                distances[source], nearest[source] = 0, source
+                if indexed:
+                    q.insert(source, 0)
+                else:
+                    q.insert(source)
+        remaining = set(targets) if targets is not None else None
         # Form shortest paths tree
-        while q:
-            distance, u = heapq.heappop(q)
-            if u in visited:
-                continue
+        while not q.is_empty():
+            if indexed:
+                u, distance = q.poll()
             else:
-                visited.add(u)
-                for e in self.incidentEdges(u):
-                    neighbour = self.oppositeVertexOnEdge(u, e)
-                    neighbour_weight = e[2]
-                    if neighbour not in visited:
-                        new_distance = distance + neighbour_weight
-                        distances[neighbour] = new_distance if new_distance < distances[neighbour] else distances[neighbour]
-                        heapq.heappush(q, [distances[neighbour], neighbour])
-        return distances
+                u = q.poll()
+                if u in visited:
+                    continue
+                distance = distances[u]
+            visited.add(u)
+            if remaining is not None:
+                remaining.discard(u)
+                if not remaining:
+                    break
+            for e in index[u]:
+                neighbour = self.oppositeVertexOnEdge(u, e)
+                new_distance = distance + e[2]
+                if neighbour not in visited and new_distance < distances.get(neighbour, float('inf')):
+                    distances[neighbour], nearest[neighbour] = new_distance, nearest[u]
+                    if not indexed:
+                        q.insert(neighbour)
+                    elif neighbour in q:
+                        q.decrease_key(neighbour, new_distance)
+                    else:
+                        q.insert(neighbour, new_distance)
+        return distances, nearest
 
     def aStarAlgorithm(self, source, destination):
         """
@@ -798,12 +1082,10 @@ class EdgeListGraph:
         """
         # Heap-based priority queue representing the open set
         # or fringe or frontier which are the discovered vertices
-        # that may need to be (re-)expanded
-        fringe = [] 
-        # Variable to keep track of order in which vertices
-        # enter the fringe. We use this to break ties when
-        # two vertices have the same fScore
-        count = 0
+        # that may need to be (re-)expanded. Each vertex is in it
+        # at most once, keyed by its f_score, and vertices with 
+        # the same f_score come out in the order they entered
+        fringe = IndexedMinHeap()
         # Dictionary with key: vertex, value: vertex. For 
         # vertex v, came_from[v] is the vertex immediately 
         # preceding it on the cheapest path from start
@@ -824,23 +1106,24 @@ class EdgeListGraph:
         # Set the f_score of the source vertex to h(source).
         f_score[source] = self.__h(source, destination)
         # Add source to fringe
-        heapq.heappush(fringe, (f_score[source], count, source))
+        fringe.insert(source, f_score[source])
         # Process vertices in A* fashion
-        while fringe:
-            current = heapq.heappop(fringe)
-            if current[2] == destination:
-                return self.__reconstruct_path(came_from, current[2])
-            for e in self.incidentEdges(current[2]):
-                neighbour = self.oppositeVertexOnEdge(current[2], e)
-                tentative_g_score = g_score[current[2]] + e[2]
+        while not fringe.is_empty():
+            current, _ = fringe.poll()
+            if current == destination:
+                return self.__reconstruct_path(came_from, current)
+            for e in self.incidentEdges(current):
+                neighbour = self.oppositeVertexOnEdge(current, e)
+                tentative_g_score = g_score[current] + e[2]
                 if tentative_g_score < g_score[neighbour]:
                     # This path to neighbour is better than any previous one, record it!
-                    came_from[neighbour] = current[2]
+                    came_from[neighbour] = current
                     g_score[neighbour] = tentative_g_score
                     f_score[neighbour] = g_score[neighbour] + self.__h(neighbour, destination)
-                    if neighbour not in fringe:
-                        count += 1
-                        heapq.heappush(fringe, (f_score[neighbour], count, neighbour))
+                    if neighbour in fringe:
+                        fringe.decrease_key(neighbour, f_score[neighbour])
+                    else:
+                        fringe.insert(neighbour, f_score[neighbour])
         return False
 
     def __h(self, source, destination):
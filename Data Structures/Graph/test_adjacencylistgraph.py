@@ -1,5 +1,11 @@
+import sys
 import unittest
 from adjacencylistgraph import AdjacencyListGraph
+sys.path.insert(1, '../')
+from Tree.DaryHeap import DaryHeap
+from Tree.MinHeap import MinHeap
+from Tree.PairingHeap import PairingHeap
+from Tree.RadixHeap import RadixHeap
 
 class TestAdjacencyListGraph(unittest.TestCase):
     @classmethod
@@ -74,5 +80,173 @@ class TestAdjacencyListGraph(unittest.TestCase):
         self.assertEqual(self.g3.size(), 5)
         self.assertEqual(self.g4.size(), 5)
 
+    def test_induced_subgraph(self):
+        # Case: Vertex not in graph
+        self.assertRaises(ValueError, self.g3.induced_subgraph, [0, 5])
+        # Case: Subgraph keeps only edges between the given vertices
+        sub = self.g3.induced_subgraph([0, 1, 2, 4])
+        self.assertEqual(sub.order(), 4)
+        self.assertEqual(sub.size(), 3)
+        self.assertEqual(sub.has_edge(0, 1), True)
+        self.assertEqual(sub.adjacent_vertices(4), [])
+        # Case: Original graph is left untouched
+        self.assertEqual(self.g3.size(), 5)
+        # Case: Subgraph can be replicated from its change log
+        replica = AdjacencyListGraph.replay(sub.diff())
+        self.assertEqual(sub.version(), 7)
+        self.assertEqual((replica.order(), replica.size()), (4, 3))
+        for v in [0, 1, 2, 4]:
+            self.assertEqual(sorted(replica.adjacent_vertices(v)), sorted(sub.adjacent_vertices(v)))
+
+    def test_partition(self):
+        # Case: Invalid number of parts
+        self.assertRaises(ValueError, self.g3.partition, 0)
+        # Case: Two cliques joined by a single edge are split along that edge
+        g = AdjacencyListGraph()
+        for v in range(8):
+            g.add_vertex(v)
+        for clique in ([0, 2, 4, 6], [1, 3, 5, 7]):
+            for i in range(len(clique)):
+                for j in range(i + 1, len(clique)):
+                    g.add_edge(clique[i], clique[j])
+        g.add_edge(0, 1)
+        parts = g.partition(2)
+        self.assertEqual(sorted(map(sorted, parts)), [[0, 2, 4, 6], [1, 3, 5, 7]])
+        self.assertEqual(g.cut_size(parts), 1)
+        # Case: Parts are balanced and cover every vertex
+        parts = self.g2.partition(4)
+        self.assertEqual(sorted(map(len, parts)), [1, 1, 2, 2])
+        self.assertEqual(set().union(*parts), set('abcdef'))
+
+    def test_partition_subgraphs(self):
+        subgraphs = self.g2.partition_subgraphs(2)
+        self.assertEqual(sum(sub.order() for sub, boundary in subgraphs), 6)
+        # Case: Each cut edge is reported once from each side
+        cut_edges = sum(len(edges) for sub, boundary in subgraphs for edges in boundary.values())
+        self.assertEqual(cut_edges, 2 * (self.g2.size() - sum(sub.size() for sub, boundary in subgraphs)))
+        for i, (sub, boundary) in enumerate(subgraphs):
+            for v, edges in boundary.items():
+                self.assertEqual(sub.has_vertex(v), True)
+                for u, w, part in edges:
+                    self.assertNotEqual(part, i)
+                    self.assertEqual(subgraphs[part][0].has_vertex(u), True)
+
+    def test_multi_source_bfs(self):
+        # Case: Vertex not in graph
+        self.assertRaises(ValueError, self.g2.multi_source_bfs, ['z'])
+        # Case: Distances are to the nearest of several sources
+        distances, nearest = self.g2.multi_source_bfs(['a', 'f'])
+        self.assertEqual(distances, {'a': 0, 'b': 1, 'c': 1, 'd': 1, 'e': 2, 'f': 0})
+        self.assertEqual(nearest['e'], 'a')
+        self.assertEqual(nearest['d'], 'f')
+        # Case: Unreachable vertices
+        self.g2.remove_edge('a', 'c')
+        distances, nearest = self.g2.multi_source_bfs(['a'])
+        self.assertEqual((distances['e'], nearest['e']), (-1, None))
+
+    def test_multi_source_dijkstra(self):
+        distances, nearest = self.g4.multi_source_dijkstra([1, 2])
+        self.assertEqual(distances, {0: 6, 1: 0, 2: 0, 3: 4})
+        self.assertEqual(nearest, {0: 2, 1: 1, 2: 2, 3: 2})
+        # Case: Single source
+        distances, nearest = self.g4.multi_source_dijkstra([0])
+        self.assertEqual(distances, {0: 0, 1: 10, 2: 6, 3: 5})
+
+    def test_priority_queues(self):
+        # Case: Every priority queue gives the same shortest paths
+        for heap in (MinHeap, DaryHeap, PairingHeap, RadixHeap):
+            distances, nearest = self.g4.multi_source_dijkstra([1, 2], heap)
+            self.assertEqual(distances, {0: 6, 1: 0, 2: 0, 3: 4})
+            self.assertEqual(nearest, {0: 2, 1: 1, 2: 2, 3: 2})
+            self.assertEqual(self.g4.distances([(0, 1), (1, 2), (3, 1)], heap), [10, 16, 15])
+        # Case: Radix heap keys must be integers
+        self.g4.add_edge(1, 2, 0.5)
+        self.assertRaises(ValueError, self.g4.multi_source_dijkstra, [1], RadixHeap)
+
+    def test_distances(self):
+        # Case: Vertex not in graph
+        self.assertRaises(ValueError, self.g4.distances, [(0, 9)])
+        self.assertRaises(ValueError, self.g4.distances, [(9, 0)])
+        # Case: Answers come back in the order the pairs were given
+        self.assertEqual(self.g4.distances([(0, 1), (1, 2), (0, 3), (0, 0), (3, 1)]), [10, 16, 5, 0, 15])
+        # Case: Unreachable destination
+        self.g4.add_vertex(4)
+        self.assertEqual(self.g4.distances([(0, 4)]), [float('inf')])
+
+    def test_degree(self):
+        # Case: Vertex does not exist in graph
+        self.assertRaises(ValueError, self.g1.degree, 0)
+        # Case: Vertex exists in graph
+        self.assertEqual(self.g1.degree(2), 2)
+        self.assertEqual(self.g3.get_degree_sequence(), [1, 2, 2, 2, 3])
+
+    def test_to_csr(self):
+        vertices, indptr, indices, weights = self.g4.to_csr()
+        self.assertEqual(len(indptr), self.g4.order() + 1)
+        self.assertEqual(len(indices), 2 * self.g4.size())
+        for i, v in enumerate(vertices):
+            for j in range(indptr[i], indptr[i + 1]):
+                self.assertEqual(self.g4.has_edge(v, vertices[indices[j]], weights[j]), True)
+
+    def test_degree_centrality(self):
+        self.assertEqual(self.g3.degree_centrality(), {0: 0.75, 1: 0.5, 2: 0.5, 3: 0.5, 4: 0.25})
+
+    def test_pagerank(self):
+        ranks = self.g3.pagerank(tolerance = 1e-10)
+        self.assertAlmostEqual(sum(ranks.values()), 1.0)
+        # Case: Symmetric vertices have equal rank and the hub ranks highest
+        self.assertAlmostEqual(ranks[1], ranks[2])
+        self.assertEqual(max(ranks, key=ranks.get), 0)
+        # Case: Isolated vertex only receives random jumps
+        self.g3.add_vertex(5)
+        ranks = self.g3.pagerank(tolerance = 1e-10)
+        self.assertAlmostEqual(sum(ranks.values()), 1.0)
+        self.assertEqual(min(ranks, key=ranks.get), 5)
+
+    def test_betweenness_centrality(self):
+        expected = {'a': 6, 'b': 6, 'c': 4, 'd': 4, 'e': 0, 'f': 0}
+        # Case: Unnormalized counts of shortest paths through each vertex
+        centrality = self.g2.betweenness_centrality(normalized = False)
+        for v in expected:
+            self.assertAlmostEqual(centrality[v], expected[v])
+        # Case: Normalized by the number of pairs of other vertices
+        self.assertAlmostEqual(self.g2.betweenness_centrality()['a'], 0.6)
+        # Case: Accumulated across worker processes
+        centrality = self.g2.betweenness_centrality(normalized = False, processes = 2)
+        for v in expected:
+            self.assertAlmostEqual(centrality[v], expected[v])
+        # Case: Sampling every vertex is exact
+        self.assertAlmostEqual(self.g2.betweenness_centrality(samples = 6, seed = 0)['b'], 0.6)
+
+    def test_diff(self):
+        # Case: Version not in change log
+        self.assertRaises(ValueError, self.g1.diff, 6)
+        self.assertRaises(ValueError, self.g1.diff, -1)
+        # Case: Every mutation is recorded in order
+        self.assertEqual(self.g1.version(), 5)
+        self.assertEqual(self.g1.diff(3), [('add_edge', (1, 2, 0)), ('add_edge', (2, 3, 0))])
+        self.g1.remove_vertex(1)
+        self.assertEqual(self.g1.diff(5), [('remove_edge', (1, 2, 0)), ('remove_vertex', (1,))])
+        # Case: Failed mutations are not recorded
+        self.assertRaises(ValueError, self.g1.add_vertex, 2)
+        self.g1.remove_edge(2, 3, 5)
+        self.assertEqual(self.g1.version(), 7)
+
+    def test_apply(self):
+        # Case: Unknown operation
+        self.assertRaises(ValueError, self.g1.apply, [('add_face', (1, 2, 3))])
+        # Case: Replica catches up from its version
+        replica = AdjacencyListGraph.replay(self.g4.diff())
+        version = replica.version()
+        self.g4.remove_vertex(0)
+        self.g4.add_vertex(4)
+        self.g4.add_edge(4, 1, 7)
+        replica.apply(self.g4.diff(version))
+        self.assertEqual(replica.version(), self.g4.version())
+        self.assertEqual(replica.order(), 4)
+        self.assertEqual(replica.size(), 3)
+        self.assertEqual(replica.has_vertex(0), False)
+        self.assertEqual(replica.has_edge(4, 1, 7), True)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,9 @@
 import unittest
 from edgelistgraph import EdgeListGraph
+from Tree.DaryHeap import DaryHeap
+from Tree.MinHeap import MinHeap
+from Tree.PairingHeap import PairingHeap
+from Tree.RadixHeap import RadixHeap
 
 class TestEdgeListGraph(unittest.TestCase):
     @classmethod
@@ -140,8 +144,22 @@ class TestEdgeListGraph(unittest.TestCase):
     def test_hasPathDFS(self):
         # Case: There exists a path between two vertices
         self.assertEqual(self.g2.hasPathDFS('a', 'f'), True)
+        # Case: Repeated calls do not share visited state
+        self.assertEqual(self.g2.hasPathDFS('a', 'c'), True)
         # Case: There does not exist a path between two vertices
-        self.assertEqual(self.g2.hasPathDFS('a', 'c'), False)
+        self.g2.removeEdge('a', 'c')
+        self.assertEqual(self.g2.hasPathDFS('a', 'e'), False)
+
+    def test_findPathDFS(self):
+        # Case: There exists a path between two vertices
+        self.assertEqual(self.g2.findPathDFS('a', 'f'), ['a', ('a', 'b', 0), 'b', ('b', 'd', 0), 'd', ('d', 'f', 0), 'f'])
+        # Case: Source and destination are the same vertex
+        self.assertEqual(self.g2.findPathDFS('c', 'c'), ['c'])
+        # Case: There does not exist a path between two vertices
+        self.g2.removeEdge('a', 'c')
+        self.assertEqual(self.g2.findPathDFS('a', 'e'), None)
+        # Case: Vertex not in graph
+        self.assertRaises(ValueError, self.g2.findPathDFS, 'a', 'z')
 
     def test_isCyclic(self):
         # Case: Acyclic graph
@@ -150,6 +168,30 @@ class TestEdgeListGraph(unittest.TestCase):
         self.g2.addEdge('b', 'c')
         self.assertEqual(self.g2.isCyclic(), True)
 
+    def test_findCycle(self):
+        # Case: Acyclic graph
+        self.assertEqual(self.g2.findCycle(), None)
+        # Case: Cyclic graph
+        cycle = self.g3.findCycle()
+        self.assertEqual(sorted(cycle), [0, 1, 2])
+        for i in range(len(cycle)):
+            self.assertEqual(self.g3.areAdjacentVertices(cycle[i - 1], cycle[i]), True)
+
+    def test_deepTraversals(self):
+        # Case: Path graph much longer than the recursion limit
+        g = EdgeListGraph()
+        n = 5000
+        for v in range(n):
+            g.addVertex(v)
+        for v in range(1, n):
+            g.addEdge(v - 1, v)
+        self.assertEqual(g.hasPathDFS(0, n - 1), True)
+        self.assertEqual(len(g.findPathDFS(0, n - 1)), 2 * n - 1)
+        self.assertEqual(g.countConnectedComponents(), 1)
+        self.assertEqual(g.isCyclic(), False)
+        g.addEdge(0, n - 1)
+        self.assertEqual(len(g.findCycle()), n)
+
     def test_isTree(self):
         # Case: Graph is not a tree
         self.assertEqual(self.g3.isTree(), False)
@@ -166,6 +208,16 @@ class TestEdgeListGraph(unittest.TestCase):
         # Case: Vertex is not a cut-vertex
         self.assertEqual(self.g3.isCutVertex(1), False)
 
+    def test_cutQueriesLeaveChangeLog(self):
+        # Case: Cut queries do not modify the graph or its change log
+        version = self.g3.version()
+        log = self.g3.diff(0)
+        self.assertEqual(self.g3.findAllCutEdges(), {(0, 3, 0), (3, 4, 0)})
+        self.assertEqual(self.g3.findAllCutVertices(), {0, 3})
+        self.assertEqual(self.g3.version(), version)
+        self.assertEqual(self.g3.diff(0), log)
+        self.assertEqual(self.g3.diff(version), [])
+
     def test_shortestPathUnweighted(self):
         # Case: There exists a path between two vertices
         self.assertEqual(self.g3.shortestPathUnweighted(0, 4), 2)
@@ -185,5 +237,84 @@ class TestEdgeListGraph(unittest.TestCase):
         # Case: Weighted graph
         self.assertEqual(self.g4.primsAlgorithm(), 19)
 
+    def test_aStarAlgorithm(self):
+        # Case: Source is the destination
+        self.assertEqual(self.g2.aStarAlgorithm('a', 'a'), 'a')
+        # Case: Path through the fringe
+        self.assertEqual(self.g2.aStarAlgorithm('a', 'f'), 'a -> b -> d -> f')
+        self.assertEqual(self.g2.aStarAlgorithm('e', 'd'), 'e -> c -> a -> b -> d')
+
+    def test_multiSourceBFS(self):
+        # Case: Vertex not in graph
+        self.assertRaises(ValueError, self.g2.multiSourceBFS, ['z'])
+        # Case: Distances are to the nearest of several sources
+        distances, nearest = self.g2.multiSourceBFS(['a', 'f'])
+        self.assertEqual(distances, {'a': 0, 'b': 1, 'c': 1, 'd': 1, 'e': 2, 'f': 0})
+        self.assertEqual(nearest['e'], 'a')
+        self.assertEqual(nearest['d'], 'f')
+        # Case: Unreachable vertices
+        self.g2.removeEdge('a', 'c')
+        distances, nearest = self.g2.multiSourceBFS(['a'])
+        self.assertEqual((distances['e'], nearest['e']), (-1, None))
+
+    def test_multiSourceDijkstra(self):
+        distances, nearest = self.g4.multiSourceDijkstra([1, 2])
+        self.assertEqual(distances, {0: 6, 1: 0, 2: 0, 3: 4})
+        self.assertEqual(nearest, {0: 2, 1: 1, 2: 2, 3: 2})
+        # Case: Single source
+        distances, nearest = self.g4.multiSourceDijkstra([0])
+        self.assertEqual(distances, {0: 0, 1: 10, 2: 6, 3: 5})
+
+    def test_priorityQueues(self):
+        # Case: Every priority queue gives the same shortest paths and spanning tree
+        for heap in (MinHeap, DaryHeap, PairingHeap, RadixHeap):
+            self.assertEqual(self.g4.dijkstrasAlgorithm(0, heap), {0: 0, 1: 10, 2: 6, 3: 5})
+            self.assertEqual(self.g4.distances([(1, 2), (3, 1)], heap), [16, 15])
+        for heap in (MinHeap, DaryHeap, PairingHeap):
+            self.assertEqual(self.g4.primsAlgorithm(heap), 19)
+        # Case: Radix heap keys must be integers
+        self.g4.addEdge(1, 2, 0.5)
+        self.assertRaises(ValueError, self.g4.dijkstrasAlgorithm, 1, RadixHeap)
+
+    def test_distances(self):
+        # Case: Vertex not in graph
+        self.assertRaises(ValueError, self.g4.distances, [(0, 9)])
+        self.assertRaises(ValueError, self.g4.distances, [(9, 0)])
+        # Case: Answers come back in the order the pairs were given
+        self.assertEqual(self.g4.distances([(0, 1), (1, 2), (0, 3), (0, 0), (3, 1)]), [10, 16, 5, 0, 15])
+        # Case: Unreachable destination
+        self.g4.addVertex(4)
+        self.assertEqual(self.g4.distances([(0, 4)]), [float('inf')])
+
+    def test_diff(self):
+        # Case: Version not in change log
+        self.assertRaises(ValueError, self.g1.diff, 6)
+        self.assertRaises(ValueError, self.g1.diff, -1)
+        # Case: Every mutation is recorded in order
+        self.assertEqual(self.g1.version(), 5)
+        self.assertEqual(self.g1.diff(3), [('add_edge', (1, 2, 0)), ('add_edge', (2, 3, 0))])
+        self.g1.removeVertex(1)
+        self.assertEqual(self.g1.diff(5), [('remove_edge', (1, 2, 0)), ('remove_vertex', (1,))])
+        # Case: Failed mutations are not recorded
+        self.assertRaises(ValueError, self.g1.addVertex, 2)
+        self.g1.removeEdge(2, 3, 5)
+        self.assertEqual(self.g1.version(), 7)
+
+    def test_apply(self):
+        # Case: Unknown operation
+        self.assertRaises(ValueError, self.g1.apply, [('add_face', (1, 2, 3))])
+        # Case: Replica catches up from its version
+        replica = EdgeListGraph.replay(self.g4.diff())
+        version = replica.version()
+        self.g4.removeVertex(0)
+        self.g4.addVertex(4)
+        self.g4.addEdge(4, 1, 7)
+        replica.apply(self.g4.diff(version))
+        self.assertEqual(replica.version(), self.g4.version())
+        self.assertEqual(replica.order(), 4)
+        self.assertEqual(replica.size(), 3)
+        self.assertEqual(replica.hasVertex(0), False)
+        self.assertEqual(replica.hasEdge(4, 1, 7), True)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,125 @@
+import threading
+from array import array
+
+class ConcurrentDisjointSet:
+    """
+    Class representing a disjoint set data structure that many
+    threads can update at once, with the same make_set, find,
+    union and largest_ds API as DisjointSet.
+
+    - find never takes a lock. Path halving only ever repoints a
+    node at one of its ancestors, and unions only ever add links,
+    so a racing halving step can make a path longer than it needs
+    to be but never wrong.
+    - union locks only the stripes of the two roots it links, in
+    the order of the stripe indices so that two unions cannot
+    deadlock. Once the locks are held it checks that both are
+    still roots and, like a failed compare-and-swap, retries from
+    find if another union got there first. Unions on unrelated
+    sets therefore proceed in parallel.
+    - make_set takes a registry lock, since it grows the arrays.
+    """
+    def __init__(self, stripes = 64):
+        # maps each element to its integer id and back
+        self.ids = {}
+        self.elements = []
+
+        # parent[i] is the parent of i, roots are their own parent
+        self.parent = array('i')
+
+        # sizes[r] is the number of elements in the set rooted at r
+        self.sizes = array('i')
+
+        # Store max size disjoint set
+        self.largest_ds = 0
+
+        self.__registry_lock = threading.Lock()
+        self.__largest_lock = threading.Lock()
+        self.__stripes = [threading.Lock() for _ in range(stripes)]
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __contains__(self, element):
+        return element in self.ids
+
+    # perform MakeSet operation
+    def make_set(self, element):
+        # create a disjoint set from the given element
+        with self.__registry_lock:
+            if element in self.ids:
+                raise ValueError('Element already in disjoint set!')
+            i = len(self.elements)
+            self.parent.append(i)
+            self.sizes.append(1)
+            self.elements.append(element)
+            # publish the id last so other threads never see a half-made set
+            self.ids[element] = i
+        self.__update_largest(1)
+
+    # Find the root of the set in which element `k` belongs
+    def find(self, k):
+        return self.elements[self.__root(self.__id(k))]
+
+    # Perform Union of two subsets, return True if two sets were merged
+    def union(self, a, b):
+        a, b = self.__id(a), self.__id(b)
+        while True:
+            x, y = self.__root(a), self.__root(b)
+
+            # if `x` and `y` are present in the same set
+            if x == y:
+                return False
+
+            # lock the stripes in the order of their indices, not of the roots
+            i, j = sorted((x % len(self.__stripes), y % len(self.__stripes)))
+            first, second = self.__stripes[i], self.__stripes[j]
+            with first:
+                if second is first:
+                    merged = self.__link(x, y)
+                else:
+                    with second:
+                        merged = self.__link(x, y)
+            if merged is not None:
+                self.__update_largest(merged)
+                return True
+
+    # Return the number of elements in the set in which element `k` belongs
+    def set_size(self, k):
+        i = self.__id(k)
+        while True:
+            root = self.__root(i)
+            size = self.sizes[root]
+            # the size is only meaningful if root was still a root when it was read
+            if self.parent[root] == root:
+                return size
+
+    def __link(self, x, y):
+        # another union may have attached x or y since they were found
+        if self.parent[x] != x or self.parent[y] != y:
+            return None
+        # Always attach the smaller tree under the root of the larger tree.
+        if self.sizes[x] < self.sizes[y]:
+            x, y = y, x
+        self.sizes[x] += self.sizes[y]
+        self.parent[y] = x
+        return self.sizes[x]
+
+    def __update_largest(self, size):
+        if size > self.largest_ds:
+            with self.__largest_lock:
+                self.largest_ds = max(self.largest_ds, size)
+
+    def __root(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            # path halving: make every other node on the path point to its grandparent
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def __id(self, element):
+        i = self.ids.get(element)
+        if i is None:
+            raise ValueError('Element not in disjoint set!')
+        return i
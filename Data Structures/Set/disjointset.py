@@ -1,46 +1,262 @@
+from array import array
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class IntDisjointSet:
+    """
+    Class representing a disjoint set data structure over the
+    dense integer ids 0, 1, ..., n - 1. Also known as the
+    Union-Find algorithm. Parents, set sizes and the links
+    between members of a set are kept in typed arrays, so an
+    element costs 12 bytes rather than entries in several
+    dictionaries.
+    """
+    # union_many and find_many only use NumPy for batches of at least
+    # n / VECTORIZE_FRACTION elements, since each call costs O(n)
+    VECTORIZE_FRACTION = 32
+
+    def __init__(self, n = 0):
+        # parent[i] is the parent of i, roots are their own parent
+        self.parent = array('i', range(n))
+
+        # sizes[r] is the number of elements in the set rooted at r
+        self.sizes = array('i', [1]) * n
+
+        # next links the elements of each set into a circular list,
+        # so the members of a set can be listed without a full scan
+        self.next = array('i', range(n))
+
+        # Store max size disjoint set
+        self.largest_ds = 1 if n else 0
+
+        # number of disjoint sets and number of sets of each size
+        self.sets = n
+        self.histogram = {1: n} if n else {}
+
+    def __len__(self):
+        return len(self.parent)
+
+    # perform MakeSet operation
+    def make_set(self):
+        # create a singleton disjoint set and return its id
+        i = len(self.parent)
+        self.parent.append(i)
+        self.sizes.append(1)
+        self.next.append(i)
+        self.largest_ds = max(self.largest_ds, 1)
+        self.sets += 1
+        self.histogram[1] = self.histogram.get(1, 0) + 1
+        return i
+
+    # Find the root of the set in which element `k` belongs
+    def find(self, k):
+        parent = self.parent
+        while parent[k] != k:
+            # path halving: make every other node on the path point to its grandparent
+            parent[k] = parent[parent[k]]
+            k = parent[k]
+        return k
+
+    # Perform Union of two subsets and return the root of the merged set
+    def union(self, a, b):
+        # find the root of the sets in which elements `a` and `b` belongs
+        x = self.find(a)
+        y = self.find(b)
+
+        # if `x` and `y` are present in the same set
+        if x == y:
+            return x
+
+        # Always attach the smaller tree under the root of the larger tree.
+        if self.sizes[x] < self.sizes[y]:
+            x, y = y, x
+        self.__count_size(self.sizes[x], -1)
+        self.__count_size(self.sizes[y], -1)
+        self.parent[y] = x
+        self.sizes[x] += self.sizes[y]
+        self.__count_size(self.sizes[x], 1)
+        self.largest_ds = max(self.largest_ds, self.sizes[x])
+        self.sets -= 1
+        # splicing two circular lists is a swap of their next pointers
+        self.next[x], self.next[y] = self.next[y], self.next[x]
+        return x
+
+    # Return the number of disjoint sets
+    def count_sets(self):
+        return self.sets
+
+    # Iterate over the elements of the set in which element `k` belongs
+    def members(self, k):
+        yield k
+        i = self.next[k]
+        while i != k:
+            yield i
+            i = self.next[i]
+
+    # Return a snapshot of the number of sets of each size
+    def size_histogram(self):
+        return dict(self.histogram)
+
+    def __count_size(self, size, change):
+        count = self.histogram.get(size, 0) + change
+        if count:
+            self.histogram[size] = count
+        else:
+            del self.histogram[size]
+
+    # Return the number of elements in the set in which element `k` belongs
+    def set_size(self, k):
+        return self.sizes[self.find(k)]
+
+    # Perform Union of every pair (a[i], b[i]) in one call. The vectorized
+    # path makes a few O(n) passes over the whole forest, so batches that
+    # are small next to n are merged one pair at a time instead.
+    def union_many(self, a, b):
+        a = a if hasattr(a, '__len__') else list(a)
+        b = b if hasattr(b, '__len__') else list(b)
+        if len(a) != len(b):
+            raise ValueError('Arrays must have the same length!')
+        if np is None or len(a) < len(self.parent) // self.VECTORIZE_FRACTION:
+            for x, y in zip(a, b):
+                self.union(x, y)
+            return
+        # Label propagation: hook the larger root of every pair that is still
+        # split onto the smaller one, then jump pointers until every element
+        # points at its root, and repeat until no pair is split. Each round
+        # is a handful of vectorized passes over the arrays.
+        before = self.__jump_pointers(np.array(self.parent, dtype=np.int64))
+        parent = before.copy()
+        a, b = np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64)
+        while True:
+            parent = self.__jump_pointers(parent)
+            root_a, root_b = parent[a], parent[b]
+            split = root_a != root_b
+            if not split.any():
+                break
+            a, b = a[split], b[split]
+            root_a, root_b = root_a[split], root_b[split]
+            np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+        self.parent = array('i', parent.astype(np.int32).tobytes())
+        # Only the roots that were merged away change sizes, lists and counts
+        roots = np.flatnonzero(before == np.arange(len(before)))
+        merged = roots[parent[roots] != roots]
+        self.__absorb(merged.tolist(), parent[merged].tolist())
+
+    def __absorb(self, merged, into):
+        # merge the statistics of each old root merged[i] into its new root into[i]
+        sizes, following = self.sizes, self.next
+        targets = set(into)
+        for x in targets:
+            self.__count_size(sizes[x], -1)
+        for y, x in zip(merged, into):
+            self.__count_size(sizes[y], -1)
+            sizes[x] += sizes[y]
+            # splicing two circular lists is a swap of their next pointers
+            following[x], following[y] = following[y], following[x]
+        for x in targets:
+            self.__count_size(sizes[x], 1)
+            self.largest_ds = max(self.largest_ds, sizes[x])
+        self.sets -= len(merged)
+
+    # Find the roots of many elements in one call, all elements if `keys` is None.
+    # The roots are returned in an array('i') whether or not NumPy is used.
+    def find_many(self, keys = None):
+        if keys is not None and not hasattr(keys, '__len__'):
+            keys = list(keys)
+        count = len(self.parent) if keys is None else len(keys)
+        if np is None or count < len(self.parent) // self.VECTORIZE_FRACTION:
+            keys = range(len(self.parent)) if keys is None else keys
+            return array('i', (self.find(k) for k in keys))
+        parent = self.__jump_pointers(np.array(self.parent, dtype=np.int64))
+        # keep the fully compressed forest so later finds are one step
+        self.parent = array('i', parent.astype(np.int32).tobytes())
+        if keys is not None:
+            parent = parent[np.asarray(keys, dtype=np.int64)]
+        return array('i', parent.astype(np.int32).tobytes())
+
+    def __jump_pointers(self, parent):
+        # replace every parent with its grandparent until nothing changes
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                return parent
+            parent = grandparent
+
 class DisjointSet:
     """
     Class representing a disjoint set data structure.
-    Also known as the Union-Find algorithm.
+    Also known as the Union-Find algorithm. Elements
+    can be any hashable values, each one is mapped to
+    a dense integer id in an IntDisjointSet.
     """
-    parent = {}
- 
-    # stores the depth of trees
-    rank = {}
-    
+    def __init__(self):
+        # maps each element to its integer id and back
+        self.ids = {}
+        self.elements = []
+
+        # union-find over the integer ids
+        self.forest = IntDisjointSet()
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __contains__(self, element):
+        return element in self.ids
+
     # Store max size disjoint set
-    largest_ds = 0
-    
+    @property
+    def largest_ds(self):
+        return self.forest.largest_ds
+
     # perform MakeSet operation
     def make_set(self, element):
         # create a disjoint set from the given element
-        self.parent[element] = element
-        self.rank[element] = 1
- 
+        if element in self.ids:
+            raise ValueError('Element already in disjoint set!')
+        self.ids[element] = self.forest.make_set()
+        self.elements.append(element)
+
     # Find the root of the set in which element `k` belongs
     def find(self, k):
-        # if `k` is not the root
-        if self.parent[k] != k:
-            # path compression
-            self.parent[k] = self.find(self.parent[k])
-        return self.parent[k]
- 
+        return self.elements[self.forest.find(self.__id(k))]
+
     # Perform Union of two subsets
     def union(self, a, b):
-        # find the root of the sets in which elements `x` and `y` belongs
-        x = self.find(a)
-        y = self.find(b)
- 
-        # if `x` and `y` are present in the same set
-        if x == y:
-            return
- 
-        # Always attach a smaller depth tree under the root of the deeper tree.
-        if self.rank[x] > self.rank[y]:
-            self.parent[y] = x
-            self.rank[x] += self.rank[y]
-            self.largest_ds = max(self.largest_ds, self.rank[x])
-        elif self.rank[x] <= self.rank[y]:
-            self.parent[x] = y
-            self.rank[y] += self.rank[x]
-            self.largest_ds = max(self.largest_ds, self.rank[y])
\ No newline at end of file
+        self.forest.union(self.__id(a), self.__id(b))
+
+    # Return the number of elements in the set in which element `k` belongs
+    def set_size(self, k):
+        return self.forest.set_size(self.__id(k))
+
+    # Perform Union of every pair (a[i], b[i]) in one call
+    def union_many(self, a, b):
+        # read the inputs once, since they may be generators
+        ids, a, b = self.ids, list(a), list(b)
+        if not all(x in ids for x in a) or not all(y in ids for y in b):
+            raise ValueError('Element not in disjoint set!')
+        self.forest.union_many([ids[x] for x in a], [ids[y] for y in b])
+
+    # Return the number of disjoint sets
+    def count_sets(self):
+        return self.forest.count_sets()
+
+    # Iterate over the elements of the set in which element `k` belongs
+    def members(self, k):
+        return (self.elements[i] for i in self.forest.members(self.__id(k)))
+
+    # Return a snapshot of the number of sets of each size
+    def size_histogram(self):
+        return self.forest.size_histogram()
+
+    # Find the root of many elements in one call, all elements if `keys` is None
+    def find_many(self, keys = None):
+        if keys is None:
+            return [self.elements[r] for r in self.forest.find_many()]
+        return [self.elements[r] for r in self.forest.find_many([self.__id(k) for k in keys])]
+
+    def __id(self, element):
+        if element not in self.ids:
+            raise ValueError('Element not in disjoint set!')
+        return self.ids[element]
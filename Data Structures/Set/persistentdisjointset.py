@@ -0,0 +1,108 @@
+class PersistentDisjointSet:
+    """
+    Class representing a fully persistent disjoint set over the
+    integer ids 0, 1, ..., n - 1. Every union creates a new version
+    and leaves the version it was applied to untouched, so any past
+    version can be queried or extended with further unions, and
+    versions form a tree rather than a line.
+
+    The parent and size of each id are stored in a persistent array:
+    a binary trie over the bits of the id in which a write copies only
+    the O(log(n)) nodes on the path to the changed leaf. Leaves that
+    were never written hold None and stand for a singleton set. With
+    union by size and no path compression, find takes O(log(n)) steps
+    of O(log(n)) each.
+
+    Version 0 is the partition into n singletons.
+    """
+    def __init__(self, n):
+        self.n = n
+
+        # number of bits needed to address an id in the trie
+        self.depth = max(1, (n - 1).bit_length())
+
+        # (trie root, largest set size) of each version
+        self.versions = [(None, 1 if n else 0)]
+
+    def __len__(self):
+        return self.n
+
+    # Return the id of the most recent version
+    def latest(self):
+        return len(self.versions) - 1
+
+    # Find the root of the set in which element `k` belongs in the given version
+    def find(self, k, version = None):
+        root = self.__version(version)[0]
+        self.__check(k)
+        parent, size = self.__get(root, k)
+        while parent != k:
+            k = parent
+            parent, size = self.__get(root, k)
+        return k
+
+    # Return boolean indicating if `a` and `b` are in the same set in the given version
+    def connected(self, a, b, version = None):
+        return self.find(a, version) == self.find(b, version)
+
+    # Return the number of elements in the set in which element `k` belongs in the given version
+    def set_size(self, k, version = None):
+        return self.__get(self.__version(version)[0], self.find(k, version))[1]
+
+    # Return the size of the largest set in the given version
+    def largest_ds(self, version = None):
+        return self.__version(version)[1]
+
+    # Perform Union of two subsets on the given version and return the resulting version
+    def union(self, a, b, version = None):
+        version = self.latest() if version is None else version
+        root, largest_ds = self.__version(version)
+        x, y = self.find(a, version), self.find(b, version)
+
+        # if `x` and `y` are present in the same set nothing changes
+        if x == y:
+            return version
+
+        # Always attach the smaller tree under the root of the larger tree.
+        size_x, size_y = self.__get(root, x)[1], self.__get(root, y)[1]
+        if size_x < size_y:
+            x, y, size_x, size_y = y, x, size_y, size_x
+        root = self.__set(root, y, (x, size_y))
+        root = self.__set(root, x, (x, size_x + size_y))
+        self.versions.append((root, max(largest_ds, size_x + size_y)))
+        return self.latest()
+
+    def __version(self, version):
+        if version is None:
+            return self.versions[-1]
+        if not 0 <= version < len(self.versions):
+            raise ValueError('Version not in disjoint set!')
+        return self.versions[version]
+
+    def __check(self, k):
+        if not 0 <= k < self.n:
+            raise ValueError('Element not in disjoint set!')
+
+    def __get(self, root, k):
+        # walk the trie from the most significant bit of k
+        node = root
+        for bit in range(self.depth - 1, -1, -1):
+            if node is None:
+                break
+            node = node[(k >> bit) & 1]
+        return (k, 1) if node is None else node
+
+    def __set(self, root, k, value):
+        # collect the path to the leaf, then copy it bottom-up
+        path, node = [], root
+        for bit in range(self.depth - 1, -1, -1):
+            path.append(node)
+            node = None if node is None else node[(k >> bit) & 1]
+        node = value
+        for bit in range(self.depth):
+            parent = path.pop()
+            if (k >> bit) & 1:
+                node = (None if parent is None else parent[0], node)
+            else:
+                node = (node, None if parent is None else parent[1])
+        return node
@@ -0,0 +1,97 @@
+from array import array
+
+class RollbackDisjointSet:
+    """
+    Class representing a disjoint set data structure whose unions
+    can be undone. Union by size keeps every tree O(log(n)) deep,
+    and find does not compress paths, so each union changes exactly
+    one parent pointer and one size. Those changes are pushed onto
+    a history stack, and rolling back pops them in O(1) per union.
+    This suits offline dynamic connectivity and backtracking search,
+    where many scenarios are explored from a shared base.
+    """
+    def __init__(self):
+        # maps each element to its integer id and back
+        self.ids = {}
+        self.elements = []
+
+        # parent[i] is the parent of i, roots are their own parent
+        self.parent = array('i')
+
+        # sizes[r] is the number of elements in the set rooted at r
+        self.sizes = array('i')
+
+        # Store max size disjoint set
+        self.largest_ds = 0
+
+        # (attached root, new parent, previous largest_ds) for each union
+        self.history = []
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __contains__(self, element):
+        return element in self.ids
+
+    # perform MakeSet operation
+    def make_set(self, element):
+        # create a disjoint set from the given element
+        if element in self.ids:
+            raise ValueError('Element already in disjoint set!')
+        i = len(self.elements)
+        self.ids[element] = i
+        self.elements.append(element)
+        self.parent.append(i)
+        self.sizes.append(1)
+        self.largest_ds = max(self.largest_ds, 1)
+
+    # Find the root of the set in which element `k` belongs
+    def find(self, k):
+        return self.elements[self.__root(self.__id(k))]
+
+    # Perform Union of two subsets, return True if two sets were merged
+    def union(self, a, b):
+        x = self.__root(self.__id(a))
+        y = self.__root(self.__id(b))
+
+        # if `x` and `y` are present in the same set
+        if x == y:
+            return False
+
+        # Always attach the smaller tree under the root of the larger tree.
+        if self.sizes[x] < self.sizes[y]:
+            x, y = y, x
+        self.history.append((y, x, self.largest_ds))
+        self.parent[y] = x
+        self.sizes[x] += self.sizes[y]
+        self.largest_ds = max(self.largest_ds, self.sizes[x])
+        return True
+
+    # Return the number of elements in the set in which element `k` belongs
+    def set_size(self, k):
+        return self.sizes[self.__root(self.__id(k))]
+
+    # Return a token for the current state that rollback can return to
+    def checkpoint(self):
+        return len(self.history)
+
+    # Undo every union performed after the checkpoint `to`
+    def rollback(self, to):
+        if not 0 <= to <= len(self.history):
+            raise ValueError('Checkpoint not in history!')
+        while len(self.history) > to:
+            y, x, largest_ds = self.history.pop()
+            self.parent[y] = y
+            self.sizes[x] -= self.sizes[y]
+            self.largest_ds = largest_ds
+
+    def __root(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    def __id(self, element):
+        if element not in self.ids:
+            raise ValueError('Element not in disjoint set!')
+        return self.ids[element]
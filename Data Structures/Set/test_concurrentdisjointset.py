@@ -0,0 +1,87 @@
+import random
+import sys
+import threading
+import time
+import unittest
+from concurrentdisjointset import ConcurrentDisjointSet
+from disjointset import DisjointSet
+
+class TestConcurrentDisjointSet(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        print('Setting up TestConcurrentDisjointSet test suite')
+
+    @classmethod
+    def tearDownClass(cls):
+        print('')
+        print('Tearing down TestConcurrentDisjointSet test suite')
+
+    def setUp(self):
+        self.n = 3000
+        self.ds = ConcurrentDisjointSet(stripes=4)
+        self.reference = DisjointSet()
+        for i in range(self.n):
+            self.ds.make_set(i)
+            self.reference.make_set(i)
+
+    def test_make_set(self):
+        # Case: Element already in disjoint set
+        self.assertRaises(ValueError, self.ds.make_set, 0)
+        # Case: Element not in disjoint set
+        self.assertRaises(ValueError, self.ds.find, self.n)
+        self.assertEqual(len(self.ds), self.n)
+
+    def test_union(self):
+        # Case: Roots whose ids are ordered differently from their stripes
+        self.assertTrue(self.ds.union(1, 6))
+        self.assertTrue(self.ds.union(2, 5))
+        self.assertFalse(self.ds.union(6, 1))
+        self.assertEqual(self.ds.set_size(1), 2)
+        self.assertEqual(self.ds.largest_ds, 2)
+
+    def test_lock_order(self):
+        # Case: A union holding the lower stripe can always take the higher one
+        stripes = self.ds._ConcurrentDisjointSet__stripes
+        stripes[1].acquire()
+        other = threading.Thread(target=self.ds.union, args=(2, 5))
+        other.start()
+        time.sleep(0.1)
+        acquired = stripes[2].acquire(timeout=1)
+        if acquired:
+            stripes[2].release()
+        stripes[1].release()
+        other.join(timeout=5)
+        self.assertTrue(acquired)
+        self.assertEqual(self.ds.find(2), self.ds.find(5))
+
+    def test_threaded_unions(self):
+        random.seed(34)
+        pairs = [(random.randrange(self.n), random.randrange(self.n)) for _ in range(4000)]
+        for a, b in pairs:
+            self.reference.union(a, b)
+
+        def worker(chunk):
+            for a, b in chunk:
+                self.ds.union(a, b)
+                self.ds.find(a)
+
+        # Switch threads as often as possible to interleave the unions
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        threads = [threading.Thread(target=worker, args=(pairs[i::8],)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        sys.setswitchinterval(interval)
+        # Case: No union is left waiting on a lock
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        # Case: Same partition as sequential unions
+        for a in range(self.n):
+            for b in (0, a // 2, random.randrange(self.n)):
+                self.assertEqual(self.ds.find(a) == self.ds.find(b), self.reference.find(a) == self.reference.find(b))
+            self.assertEqual(self.ds.set_size(a), self.reference.set_size(a))
+        self.assertEqual(self.ds.largest_ds, self.reference.largest_ds)
+
+if __name__ == '__main__':
+    unittest.main()
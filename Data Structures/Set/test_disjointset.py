@@ -0,0 +1,158 @@
+import random
+import unittest
+import disjointset
+from disjointset import DisjointSet, IntDisjointSet
+
+class TestDisjointSet(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        print('Setting up TestDisjointSet test suite')
+
+    @classmethod
+    def tearDownClass(cls):
+        print('')
+        print('Tearing down TestDisjointSet test suite')
+
+    def setUp(self):
+        self.n = 2000
+        random.seed(32)
+        self.pairs = [(random.randrange(self.n), random.randrange(self.n)) for _ in range(1500)]
+        self.reference = IntDisjointSet(self.n)
+        for a, b in self.pairs:
+            self.reference.union(a, b)
+
+    def assertSamePartition(self, ds):
+        for k in range(self.n):
+            self.assertEqual(ds.find(k) == ds.find(0), self.reference.find(k) == self.reference.find(0))
+            self.assertEqual(ds.find(k) == ds.find(k // 2), self.reference.find(k) == self.reference.find(k // 2))
+            self.assertEqual(ds.set_size(k), self.reference.set_size(k))
+        self.assertEqual(ds.count_sets(), self.reference.count_sets())
+        self.assertEqual(ds.largest_ds, self.reference.largest_ds)
+
+    def test_make_set(self):
+        ds = DisjointSet()
+        ds.make_set('a')
+        ds.make_set('b')
+        # Case: Element already in disjoint set
+        self.assertRaises(ValueError, ds.make_set, 'a')
+        # Case: Element not in disjoint set
+        self.assertRaises(ValueError, ds.find, 'c')
+        self.assertRaises(ValueError, ds.union, 'a', 'c')
+        self.assertRaises(ValueError, ds.set_size, 'c')
+        self.assertEqual(len(ds), 2)
+        self.assertIn('a', ds)
+        self.assertNotIn('c', ds)
+
+    def test_int_union(self):
+        ds = IntDisjointSet(6)
+        self.assertEqual(ds.count_sets(), 6)
+        self.assertEqual(ds.make_set(), 6)
+        self.assertEqual(ds.count_sets(), 7)
+        # Case: union returns the root of the merged set
+        root = ds.union(0, 1)
+        self.assertIn(root, (0, 1))
+        self.assertEqual(ds.find(0), root)
+        self.assertEqual(ds.find(1), root)
+        # Case: The smaller tree goes under the larger one
+        self.assertEqual(ds.union(2, 0), root)
+        self.assertEqual(ds.union(3, 4), ds.find(4))
+        self.assertEqual(ds.count_sets(), 4)
+        # Case: Elements already in the same set
+        self.assertEqual(ds.union(1, 2), root)
+        self.assertEqual(ds.count_sets(), 4)
+        self.assertEqual(ds.set_size(2), 3)
+        self.assertEqual(ds.largest_ds, 3)
+        self.assertNotEqual(ds.find(3), ds.find(0))
+        self.assertEqual(ds.find(5), 5)
+        ds.union(4, 1)
+        self.assertEqual(ds.count_sets(), 3)
+        self.assertEqual(ds.largest_ds, 5)
+
+    def union_many_cases(self):
+        a, b = [x for x, _ in self.pairs], [y for _, y in self.pairs]
+        # Case: One large batch, then many batches too small to vectorize
+        big = IntDisjointSet(self.n)
+        big.union_many(a, b)
+        small = IntDisjointSet(self.n)
+        for i in range(0, len(a), 10):
+            small.union_many(a[i:i + 10], b[i:i + 10])
+        # Case: Generator input is read only once
+        generated = IntDisjointSet(self.n)
+        generated.union_many((x for x in a), (y for y in b))
+        return big, small, generated
+
+    def test_union_many(self):
+        for ds in self.union_many_cases():
+            self.assertSamePartition(ds)
+        self.assertRaises(ValueError, IntDisjointSet(3).union_many, [0, 1], [2])
+
+    def test_union_many_without_numpy(self):
+        np, disjointset.np = disjointset.np, None
+        try:
+            for ds in self.union_many_cases():
+                self.assertSamePartition(ds)
+        finally:
+            disjointset.np = np
+
+    def test_find_many(self):
+        for np in (disjointset.np, None):
+            saved, disjointset.np = disjointset.np, np
+            try:
+                ds = IntDisjointSet(self.n)
+                ds.union_many(*zip(*self.pairs))
+                roots = ds.find_many()
+                # Case: Same type with and without NumPy
+                self.assertEqual(type(roots), type(ds.find_many([0, 1])))
+                self.assertEqual(list(roots), [ds.find(k) for k in range(self.n)])
+                # Case: Generator input
+                keys = [k for k in range(0, self.n, 3)]
+                self.assertEqual(list(ds.find_many(k for k in keys)), [roots[k] for k in keys])
+            finally:
+                disjointset.np = saved
+
+    def assertMatchesPartition(self, ds):
+        groups = {}
+        for k in range(self.n):
+            groups.setdefault(ds.find(k), set()).add(k)
+        for group in groups.values():
+            # start from any member, not only the root
+            members = list(ds.members(max(group)))
+            self.assertEqual(len(members), len(group))
+            self.assertEqual(set(members), group)
+        histogram = {}
+        for group in groups.values():
+            histogram[len(group)] = histogram.get(len(group), 0) + 1
+        self.assertEqual(ds.size_histogram(), histogram)
+
+    def test_members(self):
+        for np in (disjointset.np, None):
+            saved, disjointset.np = disjointset.np, np
+            try:
+                # Case: After scalar unions, one large batch and small batches
+                for ds in (self.reference,) + self.union_many_cases():
+                    self.assertMatchesPartition(ds)
+                # Case: A batch on top of sets that are already merged
+                ds = self.union_many_cases()[0]
+                ds.union_many(range(0, self.n, 2), range(1, self.n, 2))
+                self.assertMatchesPartition(ds)
+            finally:
+                disjointset.np = saved
+        # Case: The histogram is a snapshot
+        histogram = self.reference.size_histogram()
+        self.reference.union_many(range(self.n - 1), range(1, self.n))
+        self.assertNotEqual(histogram, self.reference.size_histogram())
+        self.assertEqual(self.reference.size_histogram(), {self.n: 1})
+        self.assertEqual(sorted(self.reference.members(5)), list(range(self.n)))
+
+    def test_generic_union_many(self):
+        ds = DisjointSet()
+        for k in range(self.n):
+            ds.make_set(str(k))
+        ds.union_many((str(x) for x, _ in self.pairs), (str(y) for _, y in self.pairs))
+        roots = ds.find_many()
+        self.assertEqual(roots, [ds.find(str(k)) for k in range(self.n)])
+        self.assertEqual(ds.find_many(str(k) for k in range(5)), roots[:5])
+        self.assertRaises(ValueError, ds.union_many, ['0'], ['missing'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import random
+import unittest
+from persistentdisjointset import PersistentDisjointSet
+from rollbackdisjointset import RollbackDisjointSet
+
+class TestPersistentDisjointSet(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        print('Setting up TestPersistentDisjointSet test suite')
+
+    @classmethod
+    def tearDownClass(cls):
+        print('')
+        print('Tearing down TestPersistentDisjointSet test suite')
+
+    def setUp(self):
+        self.n = 200
+        random.seed(33)
+        self.ds = PersistentDisjointSet(self.n)
+
+    def snapshot(self, version):
+        return ([self.ds.find(k, version) for k in range(self.n)],
+                [self.ds.set_size(k, version) for k in range(self.n)],
+                self.ds.largest_ds(version))
+
+    def test_union(self):
+        v1 = self.ds.union(0, 1)
+        self.assertTrue(self.ds.connected(0, 1, v1))
+        self.assertFalse(self.ds.connected(0, 1, 0))
+        # Case: Union of elements already in the same set returns the same version
+        self.assertEqual(self.ds.union(1, 0, v1), v1)
+        self.assertRaises(ValueError, self.ds.find, self.n)
+        self.assertRaises(ValueError, self.ds.find, 0, self.ds.latest() + 1)
+
+    def test_branching(self):
+        pairs = [(random.randrange(self.n), random.randrange(self.n)) for _ in range(300)]
+        base = 0
+        for a, b in pairs[:100]:
+            base = self.ds.union(a, b, base)
+        before = self.snapshot(base)
+        # Case: Two branches grown from the same version
+        left, right = base, base
+        for a, b in pairs[100:200]:
+            left = self.ds.union(a, b, left)
+        for a, b in pairs[200:]:
+            right = self.ds.union(a, b, right)
+        left_state, right_state = self.snapshot(left), self.snapshot(right)
+        # Case: Older versions stay unchanged after later unions from them
+        self.assertEqual(self.snapshot(base), before)
+        self.assertEqual(self.snapshot(0), (list(range(self.n)), [1] * self.n, 1))
+        for a, b in pairs[:100]:
+            self.ds.union(b, a, base)
+        self.assertEqual(self.snapshot(left), left_state)
+        self.assertEqual(self.snapshot(right), right_state)
+        # Case: Each branch matches applying its unions to the base alone
+        for version, chunk in ((left, pairs[:200]), (right, pairs[:100] + pairs[200:])):
+            reference = RollbackDisjointSet()
+            for k in range(self.n):
+                reference.make_set(k)
+            for a, b in chunk:
+                reference.union(a, b)
+            for k in range(self.n):
+                self.assertEqual(self.ds.connected(k, k // 3, version), reference.find(k) == reference.find(k // 3))
+                self.assertEqual(self.ds.set_size(k, version), reference.set_size(k))
+            self.assertEqual(self.ds.largest_ds(version), reference.largest_ds)
+
+if __name__ == '__main__':
+    unittest.main()
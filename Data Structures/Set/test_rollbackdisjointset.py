@@ -0,0 +1,62 @@
+import random
+import unittest
+from rollbackdisjointset import RollbackDisjointSet
+
+class TestRollbackDisjointSet(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        print('Setting up TestRollbackDisjointSet test suite')
+
+    @classmethod
+    def tearDownClass(cls):
+        print('')
+        print('Tearing down TestRollbackDisjointSet test suite')
+
+    def setUp(self):
+        self.n = 500
+        random.seed(33)
+        self.ds = RollbackDisjointSet()
+        for i in range(self.n):
+            self.ds.make_set(i)
+
+    def snapshot(self):
+        # the root and set size of every element, and the number of sets
+        roots = [self.ds.find(k) for k in range(self.n)]
+        sizes = [self.ds.set_size(k) for k in range(self.n)]
+        return roots, sizes, len(set(roots)), self.ds.largest_ds
+
+    def random_unions(self, count):
+        for _ in range(count):
+            self.ds.union(random.randrange(self.n), random.randrange(self.n))
+
+    def test_union(self):
+        self.assertTrue(self.ds.union(0, 1))
+        self.assertFalse(self.ds.union(1, 0))
+        self.assertEqual(self.ds.set_size(1), 2)
+        self.assertRaises(ValueError, self.ds.make_set, 0)
+        self.assertRaises(ValueError, self.ds.find, self.n)
+
+    def test_rollback(self):
+        self.random_unions(100)
+        base, before = self.ds.checkpoint(), self.snapshot()
+        self.random_unions(300)
+        middle, after = self.ds.checkpoint(), self.snapshot()
+        self.random_unions(300)
+        self.assertLess(self.snapshot()[2], after[2])
+        # Case: Rolling back restores roots, sizes, set counts and largest_ds
+        self.ds.rollback(middle)
+        self.assertEqual(self.snapshot(), after)
+        self.ds.rollback(base)
+        self.assertEqual(self.snapshot(), before)
+        # Case: Rolling back to the current checkpoint changes nothing
+        self.ds.rollback(self.ds.checkpoint())
+        self.assertEqual(self.snapshot(), before)
+        self.ds.rollback(0)
+        self.assertEqual(self.snapshot()[2], self.n)
+        self.assertEqual(self.ds.largest_ds, 1)
+        # Case: Checkpoint not in history
+        self.assertRaises(ValueError, self.ds.rollback, 1)
+        self.assertRaises(ValueError, self.ds.rollback, -1)
+
+if __name__ == '__main__':
+    unittest.main()
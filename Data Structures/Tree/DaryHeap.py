@@ -0,0 +1,114 @@
+class DaryHeap:
+    """
+    Class representing a d-ary Minimum Heap using a list as an auxiliary
+    data structure, with the same API as MinHeap
+
+    A d-ary heap is a complete d-ary tree with the order property of a
+    binary heap: every node is at most each of its d children. The tree
+    is only log(n) / log(d) levels deep, so insert moves an entry up
+    fewer levels, while poll compares d children at each level instead
+    of two. The d children of a node are adjacent in the list, so for
+    d = 4 or 8 they usually share a cache line and a larger heap costs
+    fewer cache misses per level than a binary one.
+
+    - root node index: i = 0
+    - parent node index: (i - 1) / d
+    - children indices: d * i + 1, ..., d * i + d
+
+    Keys and FIFO ties are handled as in MinHeap, with the keys and
+    insertion numbers in lists parallel to the heap.
+    """
+    def __init__(self, key = None, *, d = 4):
+        """Initializes DaryHeap with lists as auxiliary data structures"""
+        if d < 2:
+            raise ValueError('DaryHeap needs at least 2 children per node!')
+        self.d = d
+        self.__heap = []
+
+        # key of each element and the number of insertions before it
+        self.__keys = []
+        self.__order = []
+        self.__key = key
+        self.__inserted = 0
+
+    @classmethod
+    def from_iterable(cls, data, key = None, *, d = 4):
+        """Method to build a DaryHeap from the elements of an iterable in O(n) with Floyd's heapify"""
+        heap = cls(key, d=d)
+        heap.__heap = list(data)
+        heap.__keys = heap.__heap.copy() if key is None else [key(element) for element in heap.__heap]
+        heap.__order = list(range(len(heap.__heap)))
+        heap.__inserted = len(heap.__heap)
+        for i in range((len(heap.__heap) - 2) // d, -1, -1):
+            heap.__downheap(i)
+        return heap
+
+    def is_empty(self):
+        """Method to check if DaryHeap is empty"""
+        return len(self.__heap) == 0
+
+    def size(self):
+        """Method to return size of d-ary heap"""
+        return len(self.__heap)
+
+    def peek(self):
+        """Method to return root of DaryHeap which is also the minimum element"""
+        if self.is_empty():
+            raise ValueError('DaryHeap is empty!')
+        return self.__heap[0]
+
+    def poll(self):
+        """Method to remove and return the root of the DaryHeap i.e. the minimum element"""
+        if self.is_empty():
+            raise ValueError('DaryHeap is empty!')
+        minimum_element = self.__heap[0]
+        last_element, last_key, last_order = self.__heap.pop(), self.__keys.pop(), self.__order.pop()
+        if self.__heap:
+            self.__heap[0], self.__keys[0], self.__order[0] = last_element, last_key, last_order
+            self.__downheap(0)
+        return minimum_element
+
+    def insert(self, element):
+        """Method to insert data into a new node in the DaryHeap"""
+        self.__heap.append(element)
+        self.__keys.append(element if self.__key is None else self.__key(element))
+        self.__order.append(self.__inserted)
+        self.__inserted += 1
+        self.__upheap(len(self.__heap) - 1)
+
+    def __upheap(self, node_index):
+        """Helper method to restore the “order property” by shifting parents down into the hole left by the new entry"""
+        heap, keys, order, d = self.__heap, self.__keys, self.__order, self.d
+        element, key, rank = heap[node_index], keys[node_index], order[node_index]
+        while node_index > 0:
+            parent_index = (node_index - 1) // d
+            parent_key = keys[parent_index]
+            if not (key < parent_key or (not parent_key < key and rank < order[parent_index])):
+                break
+            heap[node_index], keys[node_index], order[node_index] = heap[parent_index], parent_key, order[parent_index]
+            node_index = parent_index
+        heap[node_index], keys[node_index], order[node_index] = element, key, rank
+
+    def __downheap(self, node_index):
+        """Helper method to restore the “order property” by moving the smallest of the d children up into the hole while it is smaller than the entry"""
+        heap, keys, order, d = self.__heap, self.__keys, self.__order, self.d
+        size = len(heap)
+        element, key, rank = heap[node_index], keys[node_index], order[node_index]
+        while d * node_index + 1 < size:
+            # Pick the smallest child, the earliest inserted one if their keys are equal
+            first_child = d * node_index + 1
+            child_index = first_child
+            for i in range(first_child + 1, min(first_child + d, size)):
+                if keys[i] < keys[child_index] or (not keys[child_index] < keys[i] and order[i] < order[child_index]):
+                    child_index = i
+            child_key = keys[child_index]
+            if not (child_key < key or (not key < child_key and order[child_index] < rank)):
+                break
+            heap[node_index], keys[node_index], order[node_index] = heap[child_index], child_key, order[child_index]
+            node_index = child_index
+        heap[node_index], keys[node_index], order[node_index] = element, key, rank
+
+    def __str__(self):
+        """Method to return string representation of d-ary heap"""
+        return '\n'.join("Parent: {} | Children: {}".format(self.__heap[i], self.__heap[self.d * i + 1:self.d * i + self.d + 1])
+                         for i in range((len(self.__heap) + self.d - 2) // self.d))
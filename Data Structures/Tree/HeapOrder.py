@@ -0,0 +1,6 @@
+import itertools
+
+# insertion counter shared by all the mergeable heaps (PairingHeap and
+# LeftistHeap), so that equal keys stay first in, first out after two
+# heaps are melded. Ties are broken as explained in MinHeap.
+insertions = itertools.count()
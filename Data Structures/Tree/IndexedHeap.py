@@ -0,0 +1,192 @@
+import operator
+
+class IndexedMinHeap:
+    """
+    Class representing an Indexed Minimum Heap of (item, priority) pairs
+    using a list as an auxiliary data structure
+
+    The heap is ordered by priority like a MinHeap, and a dictionary
+    maps every item (the handle) to its current index in the list. An
+    item can therefore be found in O(1) and its priority changed or
+    the item removed in O(log(n)), by moving it up or down from where
+    it is, instead of pushing a second entry and skipping the stale
+    one when it is polled. Each item is in the heap at most once, so
+    the heap never holds more than n entries.
+
+    Items must be hashable. Items with equal priorities come out in
+    the order they were inserted (FIFO). Sifting moves a hole along 
+    the path and writes each entry once, rather than swapping at 
+    every level.
+
+    - root node index: i = 0
+    - parent node index: (i - 1) / 2
+    - left child index: 2 * i + 1
+    - right child index: 2 * i + 2
+
+    Methods:
+        insert(item, priority): Inserts an item with the given priority
+        peek(): Returns the (item, priority) pair with the minimum priority
+        poll(): Removes and returns the (item, priority) pair with the minimum priority
+        priority(item): Returns the priority of an item
+        decrease_key(item, priority): Lowers the priority of an item
+        increase_key(item, priority): Raises the priority of an item
+        remove(item): Removes an item and returns its priority
+        contains(item): Returns boolean indicating if item is in the heap
+    """
+    # whether the first priority comes out of the heap before the second
+    _before = staticmethod(operator.lt)
+
+    def __init__(self):
+        """Initializes the heap with a list of items and dictionaries of their priorities and positions"""
+        self.__heap = []
+        self.__priority = {}
+        self.__position = {}
+
+        # the number of insertions before each item, to break ties
+        self.__order = {}
+        self.__inserted = 0
+
+    def is_empty(self):
+        """Method to check if heap is empty"""
+        return len(self.__heap) == 0
+
+    def size(self):
+        """Method to return size of heap"""
+        return len(self.__heap)
+
+    def __len__(self):
+        return len(self.__heap)
+
+    def contains(self, item):
+        """Method to return boolean indicating if item is in the heap"""
+        return item in self.__position
+
+    def __contains__(self, item):
+        return item in self.__position
+
+    def priority(self, item):
+        """Method to return the priority of an item in the heap"""
+        if item not in self.__position:
+            raise ValueError('Item not in heap!')
+        return self.__priority[item]
+
+    def peek(self):
+        """Method to return the (item, priority) pair at the root of the heap"""
+        if self.is_empty():
+            raise ValueError('{} is empty!'.format(type(self).__name__))
+        item = self.__heap[0]
+        return item, self.__priority[item]
+
+    def poll(self):
+        """Method to remove and return the (item, priority) pair at the root of the heap"""
+        if self.is_empty():
+            raise ValueError('{} is empty!'.format(type(self).__name__))
+        item = self.__heap[0]
+        return item, self.remove(item)
+
+    def insert(self, item, priority):
+        """Method to insert an item with the given priority into the heap"""
+        if item in self.__position:
+            raise ValueError('Item already in heap!')
+        self.__heap.append(item)
+        self.__priority[item] = priority
+        self.__order[item] = self.__inserted
+        self.__inserted += 1
+        self.__upheap(len(self.__heap) - 1)
+
+    def decrease_key(self, item, priority):
+        """Method to lower the priority of an item already in the heap"""
+        if priority > self.priority(item):
+            raise ValueError('New priority is greater than current priority!')
+        self.__update(item, priority)
+
+    def increase_key(self, item, priority):
+        """Method to raise the priority of an item already in the heap"""
+        if priority < self.priority(item):
+            raise ValueError('New priority is less than current priority!')
+        self.__update(item, priority)
+
+    def remove(self, item):
+        """Method to remove an item from anywhere in the heap and return its priority"""
+        if item not in self.__position:
+            raise ValueError('Item not in heap!')
+        i = self.__position.pop(item)
+        priority = self.__priority.pop(item)
+        del self.__order[item]
+        last = self.__heap.pop()
+        if i < len(self.__heap):
+            # Fill the hole with the last item, which may have to move either way
+            self.__heap[i] = last
+            self.__position[last] = i
+            self.__downheap(self.__upheap(i))
+        return priority
+
+    def __update(self, item, priority):
+        """Helper method to change the priority of an item and restore the order property"""
+        self.__priority[item] = priority
+        self.__downheap(self.__upheap(self.__position[item]))
+
+    def __precedes(self, a, b):
+        """Helper method to return boolean indicating if item a comes out of the heap before item b"""
+        priority_a, priority_b = self.__priority[a], self.__priority[b]
+        if self._before(priority_a, priority_b):
+            return True
+        return not self._before(priority_b, priority_a) and self.__order[a] < self.__order[b]
+
+    def __upheap(self, node_index):
+        """
+        Helper method to move the item at node_index up while it comes
+        out before its parent. Parents are shifted down into the hole and
+        the item is written once where it stops. Returns its final index.
+        """
+        heap, position, precedes = self.__heap, self.__position, self.__precedes
+        item = heap[node_index]
+        while node_index > 0:
+            parent = (node_index - 1) // 2
+            if not precedes(item, heap[parent]):
+                break
+            heap[node_index] = heap[parent]
+            position[heap[node_index]] = node_index
+            node_index = parent
+        heap[node_index] = item
+        position[item] = node_index
+        return node_index
+
+    def __downheap(self, node_index):
+        """
+        Helper method to move the item at node_index down while one of its
+        children comes out before it, shifting that child up into the hole
+        """
+        heap, position, precedes = self.__heap, self.__position, self.__precedes
+        item, size = heap[node_index], len(heap)
+        while 2 * node_index + 1 < size:
+            child = 2 * node_index + 1
+            if child + 1 < size and precedes(heap[child + 1], heap[child]):
+                child += 1
+            if not precedes(heap[child], item):
+                break
+            heap[node_index] = heap[child]
+            position[heap[node_index]] = node_index
+            node_index = child
+        heap[node_index] = item
+        position[item] = node_index
+
+    def __str__(self):
+        """Method to return string representation of heap"""
+        heapstr, left_child, right_child = '', None, None
+        for i in range(self.size() // 2):
+            if 2 * i + 1 < self.size():
+                left_child = self.__heap[2 * i + 1]
+            if 2 * i + 2 < self.size():
+                right_child = self.__heap[2 * i + 2]
+            heapstr += "Parent: {} | Left child: {} | Right child: {}\n".format(self.__heap[i], left_child, right_child)
+            left_child, right_child = None, None
+        return heapstr
+
+class IndexedMaxHeap(IndexedMinHeap):
+    """
+    Class representing an Indexed Maximum Heap of (item, priority) pairs.
+    It has the same methods as IndexedMinHeap, but peek and poll return
+    the pair with the maximum priority.
+    """
+    _before = staticmethod(operator.gt)
@@ -0,0 +1,124 @@
+import sys
+from collections import deque
+sys.path.insert(1, '../')
+from Tree.HeapOrder import insertions
+
+class LeftistNode:
+    """A node in the leftist heap, holding its element, its children and the length of its right spine"""
+    __slots__ = ('element', 'key', 'order', 'left', 'right', 'rank')
+
+    def __init__(self, element, key, order):
+        self.element = element
+        self.key = key
+        self.order = order
+        self.left = None
+        self.right = None
+
+        # the number of nodes on the path down the right children to a leaf
+        self.rank = 1
+
+class LeftistHeap:
+    """
+    Class representing a Leftist Heap, a mergeable minimum heap stored
+    as a binary tree, with the same API as MinHeap
+
+    Every node is at most each of its children, and the rank (length
+    of the right spine) of its left child is at least that of its right
+    child. The right spine of a heap of n elements therefore has at most
+    log(n + 1) nodes. Two heaps are melded by merging their right spines
+    like two sorted lists and swapping children wherever a rank would
+    break the leftist property on the way back up, which takes
+    O(log(n)). insert melds a one node heap and poll melds the two
+    children of the root.
+
+    Elements are ordered by key and ties broken as in MinHeap, with
+    the node numbers taken from the shared counter in HeapOrder.
+
+    Methods:
+        insert(element): Inserts an element into the heap
+        peek(): Returns the minimum element
+        poll(): Removes and returns the minimum element
+        meld(other): Moves every element of another LeftistHeap into this one
+    """
+    def __init__(self, key = None):
+        """Initializes an empty LeftistHeap"""
+        self.root = None
+        self.__key = key
+        self.__size = 0
+
+    @classmethod
+    def from_iterable(cls, data, key = None):
+        """
+        Method to build a LeftistHeap from the elements of an iterable in
+        O(n) by melding one node heaps in pairs from a queue, so that
+        most melds are between small heaps
+        """
+        heap = cls(key)
+        q = deque()
+        for element in data:
+            q.append(LeftistNode(element, element if key is None else key(element), next(insertions)))
+        heap.__size = len(q)
+        while len(q) > 1:
+            q.append(heap.__meld(q.popleft(), q.popleft()))
+        heap.root = q[0] if q else None
+        return heap
+
+    def is_empty(self):
+        """Method to check if LeftistHeap is empty"""
+        return self.root is None
+
+    def size(self):
+        """Method to return size of leftist heap"""
+        return self.__size
+
+    def peek(self):
+        """Method to return root of LeftistHeap which is also the minimum element"""
+        if self.is_empty():
+            raise ValueError('LeftistHeap is empty!')
+        return self.root.element
+
+    def insert(self, element):
+        """Method to insert data into a new node in the LeftistHeap"""
+        key = element if self.__key is None else self.__key(element)
+        self.root = self.__meld(self.root, LeftistNode(element, key, next(insertions)))
+        self.__size += 1
+
+    def poll(self):
+        """Method to remove and return the root of the LeftistHeap i.e. the minimum element"""
+        if self.is_empty():
+            raise ValueError('LeftistHeap is empty!')
+        root = self.root
+        self.root = self.__meld(root.left, root.right)
+        self.__size -= 1
+        return root.element
+
+    def meld(self, other):
+        """Method to move every element of other into this heap in O(log(n)), leaving other empty"""
+        if other is self:
+            raise ValueError('Cannot meld a LeftistHeap with itself!')
+        self.root = self.__meld(self.root, other.root)
+        self.__size += other.__size
+        other.root, other.__size = None, 0
+
+    def __meld(self, a, b):
+        """
+        Helper method to meld the trees rooted at a and b. Walk down both
+        right spines taking the node that comes out first each time, then
+        hang the rest of the other spine below the last node and fix the
+        ranks back up the path.
+        """
+        path = []
+        while a is not None and b is not None:
+            if b.key < a.key or (not a.key < b.key and b.order < a.order):
+                a, b = b, a
+            path.append(a)
+            a = a.right
+        rest = a if a is not None else b
+        for node in reversed(path):
+            node.right = rest
+            # Keep the child with the longer right spine on the left
+            if node.left is None or node.left.rank < node.right.rank:
+                node.left, node.right = node.right, node.left
+            node.rank = 1 if node.right is None else node.right.rank + 1
+            rest = node
+        return rest
@@ -1,3 +1,6 @@
+import heapq
+from array import array
+
 class MinHeap:
     """
     Class represnting a Miniumum Heap using a list as an auxiliary data structure
@@ -15,10 +18,45 @@ class MinHeap:
     - parent node index: (i - 1) / 2
     - left child index: 2 * i + 1
     - right child index: 2 * i + 2
+
+    Elements are compared by key(element) if a key function is given
+    and by themselves otherwise. The key of each element is computed 
+    once when it is inserted and kept in a list parallel to the heap;
+    without a key function that list is the heap itself, so no memory 
+    is spent on keys. A sequence number counting insertions is kept in
+    a typed array parallel to the heap, at 8 bytes per element. Elements
+    with equal keys come out in the order they were inserted (FIFO), so
+    the elements themselves never need to be comparable and callers do
+    not have to wrap them in (priority, counter, element) tuples.
     """
-    def __init__(self):
-        """Initializes MinHeap with list as auxiliary data structure"""
+    def __init__(self, key = None):
+        """Initializes MinHeap with lists as auxiliary data structures"""
         self.__heap = []
+
+        # key of each element (the elements themselves if there is no key
+        # function) and the number of insertions before it
+        self.__keys = self.__heap if key is None else []
+        self.__order = array('q')
+        self.__key = key
+        self.__inserted = 0
+
+    @classmethod
+    def from_iterable(cls, data, key = None):
+        """
+        Method to build a MinHeap from the elements of an iterable in O(n) 
+        with Floyd's heapify. The elements are stored as they are and every
+        internal node is sifted down, from the last one up to the root.
+        Most nodes are near the bottom and only move a few levels, so this 
+        is O(n) in total rather than the O(n log(n)) of n inserts.
+        """
+        heap = cls(key)
+        heap.__heap = list(data)
+        heap.__keys = heap.__heap if key is None else [key(element) for element in heap.__heap]
+        heap.__order = array('q', range(len(heap.__heap)))
+        heap.__inserted = len(heap.__heap)
+        for i in range(len(heap.__heap) // 2 - 1, -1, -1):
+            heap.__downheap(i)
+        return heap
     
     def is_empty(self):
         """Method to check if MinHeap is empty"""
@@ -28,10 +66,6 @@ class MinHeap:
         """Method to return size of min heap"""
         return len(self.__heap)
 
-    def __swap(self, i, j):
-        """Helper method to swap two nodes in MinHeap"""
-        self.__heap[i], self.__heap[j] = self.__heap[j], self.__heap[i]
-    
     def peek(self):
         """Method to return root of MinHeap which is also the minimum element"""
         if self.is_empty():
@@ -43,61 +77,168 @@ class MinHeap:
         if self.is_empty():
             raise ValueError('MinHeap is empty!')            
         minimum_element = self.__heap[0]
-        self.__heap[0] = self.__heap[len(self.__heap) - 1]
-        del self.__heap[len(self.__heap) - 1]
-        self.__downheap(0)
+        last_element, last_order = self.__heap.pop(), self.__order.pop()
+        last_key = last_element if self.__key is None else self.__keys.pop()
+        if self.__heap:
+            self.__heap[0], self.__keys[0], self.__order[0] = last_element, last_key, last_order
+            self.__downheap(0)
         return minimum_element
 
     def insert(self, element):
         """Method to insert data into a new node in the MinHeap"""
         self.__heap.append(element)
+        if self.__key is not None:
+            self.__keys.append(self.__key(element))
+        self.__order.append(self.__inserted)
+        self.__inserted += 1
         self.__upheap(len(self.__heap) - 1)
 
     def __upheap(self, node_index):
         """
-        Helper method to restore the “order property”. This involves 
-        repeatedly swapping the newly added entry with parent entries 
-        until the property is restored.
+        Helper method to restore the “order property” after the entry at
+        node_index was added. Rather than swapping the entry with its
+        parent at every level, the parents that are out of order are
+        shifted down into the hole it leaves, and the entry is written
+        once where it stops, so each level costs one assignment.
         """
-        # Base case / stopping condition
-        # Upheap terminates when new value is greater than the value 
-        # of its parent, or the top of the heap is reached.
-        if node_index == 0 or self.__heap[node_index] >= self.__heap[(node_index - 1) // 2]:
-            return
-        else:
-            self.__swap(node_index, (node_index - 1) // 2) # The parent is greater than the child so swap to maintain ordering
-            # Inductive step: Do some work to shrink the problem space
-            self.__upheap((node_index - 1) // 2) # Check if the order property is maintained at the parent node
-
-    def __downheap(self, node_index):
+        heap, keys, order = self.__heap, self.__keys, self.__order
+        element, key, rank = heap[node_index], keys[node_index], order[node_index]
+        # Upheap terminates when the parent does not need to move below 
+        # the new value, or the top of the heap is reached.
+        while node_index > 0:
+            parent_index = (node_index - 1) // 2
+            parent_key = keys[parent_index]
+            if not (key < parent_key or (not parent_key < key and rank < order[parent_index])):
+                break
+            # Move the parent down into the hole
+            heap[node_index], keys[node_index], order[node_index] = heap[parent_index], parent_key, order[parent_index]
+            node_index = parent_index
+        heap[node_index], keys[node_index], order[node_index] = element, key, rank
+
+    def __downheap(self, node_index, size = None):
         """
         Helper method performs a downheap to re-establish the “ordering property”. 
-        This involves checking whether the given node is less that its children. 
-        If it is not, then the node is swapped with the smaller of the two children, 
-        and downheap is performed again on the node in its new position.
+        The smaller of the two children of the hole is moved up into it 
+        only if it is actually smaller than the entry being sifted, and 
+        the entry is written once at the position where it stops.
+        By default this sifts in the whole heap, but heapsort passes 
+        a shorter size.
+        """
+        heap, keys, order = self.__heap, self.__keys, self.__order
+        size = len(heap) if size is None else size
+        element, key, rank = heap[node_index], keys[node_index], order[node_index]
+        while 2 * node_index + 1 < size:
+            child_index = 2 * node_index + 1
+            # Pick the smaller child, the earlier inserted one if their keys are equal
+            if child_index + 1 < size:
+                left_key, right_key = keys[child_index], keys[child_index + 1]
+                if right_key < left_key or (not left_key < right_key and order[child_index + 1] < order[child_index]):
+                    child_index += 1
+            child_key = keys[child_index]
+            if not (child_key < key or (not key < child_key and order[child_index] < rank)):
+                break
+            # Move the child up into the hole
+            heap[node_index], keys[node_index], order[node_index] = heap[child_index], child_key, order[child_index]
+            node_index = child_index
+        heap[node_index], keys[node_index], order[node_index] = element, key, rank
+
+    def heapsort(self, in_place = False):
+        """
+        Method to perform a heapsort of the nodes in the heap, returning 
+        them in ascending order.
+
+        The list is sorted in place: the root is repeatedly swapped with 
+        the last entry of the shrinking heap and sifted down, which leaves
+        the entries in descending order, and the list is then reversed.
+        By default this sorts a copy of the list and the heap is unchanged.
+        With in_place=True the heap's own list is sorted and returned 
+        without any copy, and the MinHeap is left empty.
         """
-        # Checking if this node has left and right children
-        if 2 * node_index + 1 < self.size() and 2 * node_index + 2 < self.size():
-            if self.__heap[2 * node_index + 1] < self.__heap[2 * node_index + 2]:
-                self.__swap(node_index, 2 * node_index + 1) # Swap the left child with the current node since it is < current node
-                self.__downheap(2 * node_index + 1)
-            else:
-                self.__swap(node_index, 2 * node_index + 2) # Swap the right child with the current node since it is < current node
-                self.__downheap(2 * node_index + 2)
-        elif 2 * node_index + 1 < self.size() and self.__heap[node_index] > self.__heap[2 * node_index + 1]:
-            self.__swap(node_index, 2 * node_index + 1) # Swap the left child with the current node since it is < current node
-            self.__downheap(2 * node_index + 1)
-        elif 2 * node_index + 2 < self.size() and self.__heap[node_index] > self.__heap[2 * node_index + 2]:
-            self.__swap(node_index, 2 * node_index + 2) # Swap the right child with the current node since it is < current node
-            self.__downheap(2 * node_index + 2)
-
-    def heapsort(self):
-        """Method to perform a heapsort of the nodes in the heap"""
-        copy_of_heap, sorted_list = self.__heap.copy(), []
-        while not self.is_empty():
-            sorted_list.append(self.poll())
-        self.__heap = copy_of_heap
-        return sorted_list
+        if not in_place:
+            copy_of_heap = MinHeap(self.__key)
+            copy_of_heap.__heap, copy_of_heap.__order = self.__heap.copy(), array('q', self.__order)
+            copy_of_heap.__keys = copy_of_heap.__heap if self.__key is None else self.__keys.copy()
+            return copy_of_heap.heapsort(in_place=True)
+        heap, keys, order = self.__heap, self.__keys, self.__order
+        for end in range(len(heap) - 1, 0, -1):
+            heap[0], heap[end] = heap[end], heap[0]
+            if keys is not heap:
+                keys[0], keys[end] = keys[end], keys[0]
+            order[0], order[end] = order[end], order[0]
+            self.__downheap(0, end)
+        heap.reverse()
+        self.__heap, self.__order = [], array('q')
+        self.__keys = self.__heap if self.__key is None else []
+        return heap
+
+    def sorted_iter(self):
+        """
+        Generator that lazily yields the nodes of the heap in ascending 
+        order without changing the heap, so the first k cost O(k log(k))
+        however large the heap is.
+
+        The next node in order is always a child of a node already 
+        yielded, so an auxiliary heap holds the indices of the children 
+        of the nodes yielded so far, ordered by their nodes, and starts
+        with the root. The heap must not be changed while iterating.
+        """
+        for node_index in self.__sorted_indices():
+            yield self.__heap[node_index]
+
+    @staticmethod
+    def merge(*heaps):
+        """
+        Generator that lazily yields the nodes of several MinHeaps in 
+        ascending order, as if they were one heap, without changing them.
+        Each heap is read in order like in sorted_iter and the streams are 
+        merged with heapq.merge, so taking the first k nodes of m heaps 
+        costs O(k log(k) + k log(m)) however large the heaps are, instead
+        of inserting every node into a new heap. Equal keys come out 
+        heap by heap in the order the heaps were given.
+        """
+        for entry in heapq.merge(*(heap.__sorted_entries(number) for number, heap in enumerate(heaps))):
+            yield entry[-1]
+
+    def __sorted_entries(self, number):
+        """Helper generator for merge that yields (key, heap number, insertion number, node) in ascending order"""
+        for node_index in self.__sorted_indices():
+            yield (self.__keys[node_index], number, self.__order[node_index], self.__heap[node_index])
+
+    def __sorted_indices(self):
+        """Helper generator for sorted_iter that yields the indices of the nodes in ascending order"""
+        heap, keys, order, size = self.__heap, self.__keys, self.__order, len(self.__heap)
+
+        def before(i, j):
+            # whether the node at index i comes out before the node at index j
+            return keys[i] < keys[j] or (not keys[j] < keys[i] and order[i] < order[j])
+
+        index_heap = [0] if size else []
+        while index_heap:
+            if len(heap) != size:
+                raise RuntimeError('MinHeap changed size during iteration!')
+            # Take the root of the index heap and move its last index into the hole
+            node_index, last_index = index_heap[0], index_heap.pop()
+            if index_heap:
+                i = 0
+                while 2 * i + 1 < len(index_heap):
+                    child = 2 * i + 1
+                    if child + 1 < len(index_heap) and before(index_heap[child + 1], index_heap[child]):
+                        child += 1
+                    if not before(index_heap[child], last_index):
+                        break
+                    index_heap[i] = index_heap[child]
+                    i = child
+                index_heap[i] = last_index
+            yield node_index
+            # The children of the node just yielded are now candidates
+            for child_index in (2 * node_index + 1, 2 * node_index + 2):
+                if child_index < size:
+                    i = len(index_heap)
+                    index_heap.append(child_index)
+                    while i > 0 and before(child_index, index_heap[(i - 1) // 2]):
+                        index_heap[i] = index_heap[(i - 1) // 2]
+                        i = (i - 1) // 2
+                    index_heap[i] = child_index
 
     def __str__(self):
         """Method to return string representation of minheap"""
@@ -0,0 +1,107 @@
+import sys
+sys.path.insert(1, '../')
+from Tree.HeapOrder import insertions
+
+class PairingNode:
+    """A node in the pairing heap, holding its element and links to its first child and next sibling"""
+    __slots__ = ('element', 'key', 'order', 'child', 'sibling')
+
+    def __init__(self, element, key, order):
+        self.element = element
+        self.key = key
+        self.order = order
+
+        # the leftmost child, and the next child of this node's parent
+        self.child = None
+        self.sibling = None
+
+class PairingHeap:
+    """
+    Class representing a Pairing Heap, a minimum heap stored as a
+    multi-way tree, with the same API as MinHeap
+
+    The root of the tree holds the minimum element and every node is
+    at most each of its children. Two trees are linked in O(1) by
+    making the root with the larger key the leftmost child of the
+    other, so insert (linking a one node tree) and meld (linking two
+    heaps) are O(1). poll removes the root and links its children in
+    pairs from left to right and then the pairs from right to left,
+    which takes O(log(n)) amortized time.
+
+    Keys and ties work as in MinHeap. Nodes are numbered from the
+    counter in HeapOrder, which keeps ties FIFO across melds.
+
+    Methods:
+        insert(element): Inserts an element into the heap
+        peek(): Returns the minimum element
+        poll(): Removes and returns the minimum element
+        meld(other): Moves every element of another PairingHeap into this one
+    """
+    def __init__(self, key = None):
+        """Initializes an empty PairingHeap"""
+        self.root = None
+        self.__key = key
+        self.__size = 0
+
+    def is_empty(self):
+        """Method to check if PairingHeap is empty"""
+        return self.root is None
+
+    def size(self):
+        """Method to return size of pairing heap"""
+        return self.__size
+
+    def peek(self):
+        """Method to return root of PairingHeap which is also the minimum element"""
+        if self.is_empty():
+            raise ValueError('PairingHeap is empty!')
+        return self.root.element
+
+    def insert(self, element):
+        """Method to insert data into a new node in the PairingHeap"""
+        key = element if self.__key is None else self.__key(element)
+        self.root = self.__link(self.root, PairingNode(element, key, next(insertions)))
+        self.__size += 1
+
+    def meld(self, other):
+        """Method to move every element of other into this heap in O(1), leaving other empty"""
+        if other is self:
+            raise ValueError('Cannot meld a PairingHeap with itself!')
+        self.root = self.__link(self.root, other.root)
+        self.__size += other.__size
+        other.root, other.__size = None, 0
+
+    def poll(self):
+        """Method to remove and return the root of the PairingHeap i.e. the minimum element"""
+        if self.is_empty():
+            raise ValueError('PairingHeap is empty!')
+        root = self.root
+        # First pass: link the children in pairs from left to right
+        pairs, child = [], root.child
+        while child is not None:
+            first, second = child, child.sibling
+            if second is None:
+                child = None
+            else:
+                child = second.sibling
+                second.sibling = None
+            first.sibling = None
+            pairs.append(self.__link(first, second))
+        # Second pass: link the pairs from right to left
+        new_root = None
+        while pairs:
+            new_root = self.__link(pairs.pop(), new_root)
+        self.root = new_root
+        self.__size -= 1
+        return root.element
+
+    def __link(self, a, b):
+        """Helper method to link two trees, making the root that comes out later the leftmost child of the other"""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.key < a.key or (not a.key < b.key and b.order < a.order):
+            a, b = b, a
+        b.sibling, a.child = a.child, b
+        return a
@@ -0,0 +1,88 @@
+from collections import deque
+
+class RadixHeap:
+    """
+    Class representing a Radix Heap, a minimum heap for non-negative
+    integer keys that are monotone: no key inserted is smaller than
+    the last key polled. This is the case for the distances settled by
+    Dijkstra's algorithm with integer edge weights. It has the same API
+    as MinHeap.
+
+    The heap remembers the last key polled and keeps elements in
+    buckets by the highest bit in which their key differs from it:
+    bucket 0 holds keys equal to it and bucket i keys that first differ
+    at bit i - 1. Insert only computes the bucket, in O(1). When bucket
+    0 is empty, poll empties the first non-empty bucket, makes its
+    minimum key the last key and moves its elements to lower buckets.
+    Keys only ever move to lower buckets, so each element is moved at
+    most once per bit of the largest key.
+
+    A key function and FIFO ties are supported as in MinHeap; the
+    insertion number is stored next to each key in its bucket.
+    """
+    def __init__(self, key = None):
+        """Initializes an empty RadixHeap"""
+        # (key, insertion number, element) triples by bucket, bucket 0 in insertion order
+        self.buckets = [deque()]
+        self.last = 0
+        self.__key = key
+        self.__inserted = 0
+        self.__size = 0
+
+    def is_empty(self):
+        """Method to check if RadixHeap is empty"""
+        return self.__size == 0
+
+    def size(self):
+        """Method to return size of radix heap"""
+        return self.__size
+
+    def insert(self, element):
+        """Method to insert data into the bucket of its key in the RadixHeap"""
+        key = element if self.__key is None else self.__key(element)
+        if not isinstance(key, int) or key < 0:
+            raise ValueError('RadixHeap keys must be non-negative integers!')
+        if key < self.last:
+            raise ValueError('Key is less than the last key polled!')
+        self.__bucket(key).append((key, self.__inserted, element))
+        self.__inserted += 1
+        self.__size += 1
+
+    def peek(self):
+        """Method to return the minimum element of the RadixHeap"""
+        if self.is_empty():
+            raise ValueError('RadixHeap is empty!')
+        self.__refill()
+        return self.buckets[0][0][2]
+
+    def poll(self):
+        """Method to remove and return the minimum element of the RadixHeap"""
+        if self.is_empty():
+            raise ValueError('RadixHeap is empty!')
+        self.__refill()
+        self.__size -= 1
+        return self.buckets[0].popleft()[2]
+
+    def __bucket(self, key):
+        """Helper method to return the bucket of key relative to the last key, adding buckets as keys grow"""
+        i = (key ^ self.last).bit_length()
+        while len(self.buckets) <= i:
+            self.buckets.append([])
+        return self.buckets[i]
+
+    def __refill(self):
+        """
+        Helper method to make sure bucket 0 holds the minimum key when the
+        heap is not empty, by redistributing the first non-empty bucket
+        """
+        if self.buckets[0]:
+            return
+        i = 1
+        while not self.buckets[i]:
+            i += 1
+        entries, self.buckets[i] = self.buckets[i], []
+        self.last = min(entries)[0]
+        # Every key equal to the new last key is in this bucket, so sorting
+        # them by insertion number keeps bucket 0 first in, first out
+        for entry in sorted(entries, key=lambda entry: entry[1]):
+            self.__bucket(entry[0]).append(entry)
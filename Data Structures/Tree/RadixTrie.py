@@ -0,0 +1,186 @@
+import sys
+
+class RadixNode:
+    """A node in the radix trie, labelled with the string on the edge leading to it"""
+    __slots__ = ('label', 'is_end', 'counter', 'children')
+
+    def __init__(self, label):
+        # the characters on the edge from the parent to this node
+        self.label = label
+
+        # whether this can be the end of a word
+        self.is_end = False
+
+        # a counter indicating how many times a word is inserted
+        # (if this node's is_end is True)
+        self.counter = 0
+
+        # a dictionary of child nodes
+        # keys are the first characters of their labels, values are nodes
+        self.children = {}
+
+class RadixTrie:
+    """
+    Class representing a Radix Trie (also known as a compressed
+    trie or Patricia trie)
+
+    A radix trie is a Trie in which every chain of nodes that
+    have a single child and do not end a word is merged into one
+    node, whose edge is labelled with the whole string instead
+    of a single character. A vocabulary of n words therefore
+    needs at most 2n nodes however long the words are, whereas
+    a Trie needs one node per distinct prefix. Nodes use
+    __slots__ so that they do not each carry an attribute
+    dictionary either.
+
+    The children of a node are keyed by the first character of
+    their label, and no two children share a first character, so
+    a lookup still follows exactly one child per step.
+
+    Attributes:
+        root: The root of the trie, whose label is empty
+
+    Methods:
+        insert(word): Inserts a word into the trie
+        search(word): Returns boolean indicating if word is in the trie
+        query(x): Given a prefix, return all words starting with that prefix
+        delete(word): Deletes one occurrence of a word from the trie
+        memory_stats(): Returns the number of nodes and bytes used by the trie
+    """
+    def __init__(self):
+        """The root node does not store any characters"""
+        self.root = RadixNode("")
+
+    def insert(self, word):
+        """Insert a word into the trie"""
+        node, i = self.root, 0
+        while i < len(word):
+            child = node.children.get(word[i])
+            if child is None:
+                # No edge starts with this character so the rest of the word becomes a leaf
+                child = RadixNode(word[i:])
+                node.children[word[i]] = child
+                node, i = child, len(word)
+                break
+            common = self.__common_prefix_length(child.label, word, i)
+            if common < len(child.label):
+                # The word leaves the edge part way along so split the edge
+                middle = RadixNode(child.label[:common])
+                child.label = child.label[common:]
+                middle.children[child.label[0]] = child
+                node.children[word[i]] = middle
+                child = middle
+            node, i = child, i + common
+
+        # Mark the end of a word
+        node.is_end = True
+
+        # Increment the counter to indicate that we see this word once more
+        node.counter += 1
+
+    def search(self, word):
+        """Method to return boolean indicating if word exists in trie"""
+        node, i = self.root, 0
+        while i < len(word):
+            child = node.children.get(word[i])
+            if child is None or not word.startswith(child.label, i):
+                return False
+            node, i = child, i + len(child.label)
+        return node.is_end
+
+    def query(self, x):
+        """
+        Given an input (a prefix), retrieve all words stored in
+        the trie with that prefix, sort the words by the number of
+        times they have been inserted
+        """
+        node, i = self.root, 0
+        while i < len(x):
+            child = node.children.get(x[i])
+            if child is None:
+                return []
+            # The prefix either covers the whole edge or ends part way along it
+            if not x.startswith(child.label, i) and not child.label.startswith(x[i:]):
+                return []
+            node, i = child, i + len(child.label)
+
+        # The words below node all start with the path to node
+        return sorted(self.__words(node, x[:i - len(node.label)]), key=lambda pair: pair[1], reverse=True)
+
+    def __str__(self):
+        """Method to return string representation of all words in trie"""
+        return '\n'.join(pair[0] for pair in sorted(self.__words(self.root, ""), key=lambda pair: pair[0]))
+
+    def delete(self, word):
+        """
+        Method to delete one occurrence of word from trie if it exists.
+        Returns boolean indicating if anything was deleted.
+
+        1. Find word if it exists, remembering the parent of its node
+        2. Decrement its counter and stop if the word is still present
+        3. If the node has no children remove it, otherwise if it has
+        exactly one child merge it with that child
+        4. A parent that is left with one child and does not end a
+        word is merged with that child too, so no single-child chains
+        remain
+        """
+        parent, node, i = None, self.root, 0
+        while i < len(word):
+            child = node.children.get(word[i])
+            if child is None or not word.startswith(child.label, i):
+                return False
+            parent, node, i = node, child, i + len(child.label)
+        if not node.is_end:
+            return False
+        node.counter -= 1
+        if node.counter > 0 or node is self.root:
+            node.is_end = node.counter > 0
+            return True
+        node.is_end = False
+        if not node.children:
+            del parent.children[node.label[0]]
+            if parent is not self.root and not parent.is_end and len(parent.children) == 1:
+                self.__merge_with_child(parent)
+        elif len(node.children) == 1:
+            self.__merge_with_child(node)
+        return True
+
+    def memory_stats(self):
+        """
+        Method to return a dictionary with the number of nodes in the
+        trie and an estimate of the bytes they use, counting each node,
+        its children dictionary and its label
+        """
+        nodes, size, stack = 0, 0, [self.root]
+        while stack:
+            node = stack.pop()
+            nodes += 1
+            size += sys.getsizeof(node) + sys.getsizeof(node.children) + sys.getsizeof(node.label)
+            stack.extend(node.children.values())
+        return {'nodes': nodes, 'bytes': size}
+
+    def __merge_with_child(self, node):
+        """Helper method to merge a node with its only child by appending the child's label to its own"""
+        (child,) = node.children.values()
+        node.label += child.label
+        node.is_end, node.counter, node.children = child.is_end, child.counter, child.children
+
+    def __words(self, node, prefix):
+        """Helper method to return (word, count) pairs below node, where prefix spells the path to its parent"""
+        output, stack = [], [(node, prefix)]
+        while stack:
+            node, prefix = stack.pop()
+            prefix += node.label
+            if node.is_end:
+                output.append((prefix, node.counter))
+            for child in node.children.values():
+                stack.append((child, prefix))
+        return output
+
+    def __common_prefix_length(self, label, word, start):
+        """Helper method to return the length of the common prefix of label and word[start:]"""
+        length = 0
+        limit = min(len(label), len(word) - start)
+        while length < limit and label[length] == word[start + length]:
+            length += 1
+        return length
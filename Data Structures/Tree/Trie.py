@@ -1,5 +1,14 @@
 # Credit to Albert Au Yeng for the code for a Trie in python
 # https://albertauyeung.github.io/2020/06/15/python-trie.html/
+import heapq
+import mmap
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
 
 class TrieNode:
     """A node in the trie structure"""
@@ -19,6 +28,14 @@ class TrieNode:
         # keys are characters, values are nodes
         self.children = {}
 
+        # the most frequent (word, count) pairs in the subtree rooted
+        # at this node, most frequent first, at most cache_size of them
+        self.top = []
+
+def _rank(pair):
+    """Sort key ordering (word, count) pairs by decreasing count, then alphabetically"""
+    return (-pair[1], pair[0])
+
 class Trie:
     """
     Class representing a Trie
@@ -41,58 +58,263 @@ class Trie:
     and consequently each "branch" of the trie represents 
     a unique word. 
 
+    Every node caches the cache_size most frequent words 
+    below it, which insert and delete keep up to date along 
+    the path of the word they change. A top-k query for 
+    k <= cache_size then only walks the prefix and reads the
+    cache of the node it ends at, so its cost depends on the 
+    length of the prefix and not on how many words share it.
+
+    With copy_on_write=True the trie can be read from any number
+    of threads while another thread writes to it, without readers
+    taking a lock. A write never changes a node that readers can
+    reach: it copies the nodes on the path of its word, changes
+    the copies, and then publishes them by assigning the copied
+    root to self.root, which is atomic. Every read method looks
+    up self.root once, so it sees either the old or the new trie
+    and never a half-updated children dictionary. Writers hold a
+    lock between themselves, and a batch merges many writes into
+    one published version, copying each node at most once.
+
     Attributes:
         root: The root of the trie
+        cache_size: The number of completions cached at each node
+        copy_on_write: Whether writes copy nodes instead of changing them
 
     Methods:
         insert(word): Inserts a word into the trie
         dfs(node, prefix): Performs a depth-first traversal of the trie
-        query(x): Given a prefix, return all words starting with that prefix
+        query(x, k): Given a prefix, return the k most frequent (or all) words starting with that prefix
+        fuzzy_query(word, max_edits, k): Return the k most frequent words within max_edits edits of word
+        iter_prefix(prefix, order): Lazily yields the words starting with prefix in lexicographic or count order
+        items(start, stop): Lazily yields the words in the range [start, stop) in lexicographic order
+        memory_stats(): Returns the number of nodes and bytes used by the trie
+        automaton(): Returns an Aho-Corasick automaton matching every word in the trie
+        freeze(): Returns a read-only copy of the trie stored in flat arrays
+        from_sorted(pairs): Builds a trie in one pass from (word, count) pairs in sorted order
+        batch(): Context manager publishing the writes made inside it as one version
     """
-    def __init__(self):
+    def __init__(self, cache_size = 10, copy_on_write = False):
         """
         The trie has at least the root node.
         The root node does not store any character
         """
         self.root = TrieNode("")
-    
+        self.cache_size = cache_size
+        self.copy_on_write = copy_on_write
+
+        # the unpublished root of the current batch, and the nodes created
+        # in it, which are not yet visible to readers and can be changed
+        self.__working = None
+        self.__fresh = None
+        self.__depth = 0
+        self.__lock = threading.RLock()
+
+        # whether equal suffixes share nodes, see from_sorted
+        self.minimized = False
+
+    @classmethod
+    def from_sorted(cls, pairs, minimize = False, cache_size = 10):
+        """
+        Method to build a trie in a single pass from an iterable (for
+        example a generator reading a file) of (word, count) pairs in
+        sorted order. Repeated words have their counts added.
+
+        Consecutive sorted words share their longest common prefix,
+        so only the nodes of the previous word below that prefix can
+        be finished: no later word passes through them. Each word
+        therefore only pops finished nodes off the current path and
+        pushes new nodes for the rest of the word, without walking
+        from the root, and the caches of the finished nodes are
+        computed once from their children.
+
+        If minimize is True, finished nodes that are equal to an
+        already finished node (same character, count and children)
+        are replaced by it, so equal suffixes are stored once and the
+        trie becomes a directed acyclic word graph (DAWG). A node can
+        then be reached through several prefixes, so a minimized trie
+        keeps no caches and is read-only.
+        """
+        trie = cls(0 if minimize else cache_size)
+        trie.minimized = minimize
+        register = {} if minimize else None
+        path, previous = [trie.root], None
+        for word, count in pairs:
+            if previous is not None and word < previous:
+                raise ValueError('Words are not in sorted order!')
+            common = 0
+            if previous is not None:
+                limit = min(len(word), len(previous))
+                while common < limit and word[common] == previous[common]:
+                    common += 1
+            # Nodes of the previous word below the common prefix are finished
+            while len(path) > common + 1:
+                trie.__finish(path, previous, register)
+            for char in word[common:]:
+                node = TrieNode(char)
+                path[-1].children[char] = node
+                path.append(node)
+            path[-1].is_end = True
+            path[-1].counter += count
+            previous = word
+        while path:
+            trie.__finish(path, previous or "", register)
+        return trie
+
+    def __finish(self, path, word, register):
+        """
+        Helper method for from_sorted to pop the deepest node off the path
+        once no more words can pass through it, computing its cache or,
+        when minimizing, replacing it with an equal registered node
+        """
+        depth = len(path) - 1
+        node = path.pop()
+        if register is None:
+            candidates = [pair for child in node.children.values() for pair in child.top]
+            if node.is_end and node.counter > 0:
+                candidates.append((word[:depth], node.counter))
+            node.top = heapq.nsmallest(self.cache_size, candidates, key=_rank)
+        elif depth > 0:
+            # Children are already canonical so they can be compared by identity
+            signature = (node.char, node.is_end, node.counter, tuple((char, id(child)) for char, child in sorted(node.children.items())))
+            if signature in register:
+                path[-1].children[node.char] = register[signature]
+            else:
+                register[signature] = node
+
     def insert(self, word):
         """Insert a word into the trie"""
-        node = self.root
+        if self.minimized:
+            raise ValueError('Minimized trie is read-only!')
+        if self.copy_on_write:
+            with self.batch():
+                self.__insert(word)
+        else:
+            self.__insert(word)
+
+    def __insert(self, word):
+        """Helper method to insert a word into the working trie"""
+        node = self.__working if self.copy_on_write else self.root
+        fresh = self.__fresh
+        path = [node]
         
         # Loop through each character in the word
         # Check if there is no child containing the character, create a new child for the current node
         for char in word:
-            if char in node.children:
-                node = node.children[char]
-            else:
+            child = node.children.get(char)
+            if child is None:
                 # If a character is not found,
                 # create a new node in the trie
-                new_node = TrieNode(char)
-                node.children[char] = new_node
-                node = new_node
+                child = TrieNode(char)
+                node.children[char] = child
+                if fresh is not None:
+                    fresh.add(child)
+            elif fresh is not None and child not in fresh:
+                # Readers may be on this node so change a copy of it
+                child = self.__copy(child)
+                node.children[char] = child
+            node = child
+            path.append(node)
         
         # Mark the end of a word
         node.is_end = True
 
         # Increment the counter to indicate that we see this word once more
         node.counter += 1
+
+        # The word's count only went up, so it can only move up or into each cache on its path
+        for ancestor in path:
+            self.__offer(ancestor, word, node.counter)
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager for a copy-on-write trie that publishes all the
+        inserts and deletes made inside it as a single new version when
+        it exits, so readers see either none or all of them. A node is
+        copied the first time a write in the batch passes through it and
+        changed in place after that. If the block raises, nothing is
+        published. Batches can be nested and only the outermost one
+        publishes.
+        """
+        if not self.copy_on_write:
+            raise ValueError('Batches need a copy-on-write trie!')
+        with self.__lock:
+            if self.__depth == 0:
+                self.__fresh = set()
+                self.__working = self.__copy(self.root)
+            self.__depth += 1
+            try:
+                yield self
+                if self.__depth == 1:
+                    # Publish the new version with a single atomic assignment
+                    self.root = self.__working
+            finally:
+                self.__depth -= 1
+                if self.__depth == 0:
+                    self.__working = self.__fresh = None
+
+    def __copy(self, node):
+        """Helper method to return a copy of node, with its own children dictionary and cache, that is fresh in the current batch"""
+        copy = TrieNode(node.char)
+        copy.is_end, copy.counter = node.is_end, node.counter
+        copy.children, copy.top = dict(node.children), list(node.top)
+        self.__fresh.add(copy)
+        return copy
+
+    def __offer(self, node, word, count):
+        """Helper method to update the cached top words of node after the count of word increased"""
+        top = node.top
+        for i in range(len(top)):
+            if top[i][0] == word:
+                del top[i]
+                break
+        entry = (word, count)
+        if len(top) < self.cache_size or (top and _rank(entry) < _rank(top[-1])):
+            i = len(top)
+            while i > 0 and _rank(entry) < _rank(top[i - 1]):
+                i -= 1
+            top.insert(i, entry)
+            del top[self.cache_size:]
+
+    def __refresh_top(self, path, word):
+        """
+        Helper method to recompute the cached top words of every node on 
+        path, the nodes spelling the prefixes of word, deepest first, from
+        the caches of their children. Used after a count went down, when a
+        word from outside a cache may have to take the place of one inside it.
+        """
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            candidates = [pair for child in node.children.values() for pair in child.top]
+            if node.is_end:
+                candidates.append((word[:depth], node.counter))
+            node.top = heapq.nsmallest(self.cache_size, candidates, key=_rank)
         
     def dfs(self, node, prefix):
         """
-        Depth-first traversal of the trie
+        Depth-first traversal of the trie with an explicit stack. The
+        words found are returned rather than stored on the trie, so 
+        any number of readers can traverse it at the same time.
         
         Args:
             - node: the node to start with
             - prefix: the current prefix, for tracing a
                 word while traversing the trie
+
+        Returns:
+            List of (word, count) pairs for the words below node
         """
-        if node.is_end:
-            # If a word is found then append it to our output list
-            self.output.append((prefix + node.char, node.counter))
-        
-        for child in node.children.values():
-            self.dfs(child, prefix + node.char)
+        output, stack = [], [(node, prefix)]
+        while stack:
+            node, prefix = stack.pop()
+            prefix += node.char
+            if node.is_end:
+                # If a word is found then append it to our output list
+                output.append((prefix, node.counter))
+            for child in node.children.values():
+                stack.append((child, prefix))
+        return output
         
     def search(self, word):
         """Method to return boolean indicating if word exists in trie"""
@@ -104,15 +326,14 @@ class Trie:
                 return False
         return node.is_end
 
-    def query(self, x):
+    def query(self, x, k = None):
         """
         Given an input (a prefix), retrieve all words stored in
         the trie with that prefix, sort the words by the number of 
-        times they have been inserted
+        times they have been inserted. If k is given only the k most
+        frequent words are returned, and if k is at most cache_size 
+        they are read from the cache of the node the prefix ends at.
         """
-        # Use a variable within the class to keep all possible outputs
-        # As there can be more than one word with such prefix
-        self.output = []
         node = self.root
         
         # Check if the prefix is in the trie
@@ -122,61 +343,421 @@ class Trie:
             else:
                 # cannot found the prefix, return empty list
                 return []
+
+        if k is not None and k <= self.cache_size:
+            return node.top[:k]
         
-        # Traverse the trie to get all candidates
-        self.dfs(node, x[:-1])
+        # Traverse the trie to get all candidates, sort them in reverse order and return
+        return sorted(self.dfs(node, x[:-1]), key=_rank)[:k]
+
+    def fuzzy_query(self, word, max_edits, k = None):
+        """
+        Given a word, retrieve the k most frequent words stored in the 
+        trie (all of them if k is None) whose Levenshtein distance to 
+        the word is at most max_edits, sorted by the number of times 
+        they have been inserted.
 
-        # Sort the results in reverse order and return
-        return sorted(self.output, key=lambda x: x[1], reverse=True)
+        Walking down the trie extends the Levenshtein table of the word 
+        against the current prefix by one row per character. Every word 
+        below a node shares its prefix, so each node computes a single 
+        row from its parent's row in O(len(word)) and a subtree is 
+        pruned as soon as the smallest entry of its row exceeds 
+        max_edits, since no extension of the prefix can do better.
+        """
+        matches = []
+        stack = [(self.root, "", list(range(len(word) + 1)))]
+        while stack:
+            node, prefix, row = stack.pop()
+            if node.is_end and node.counter > 0 and row[-1] <= max_edits:
+                matches.append((prefix, node.counter))
+            if min(row) > max_edits:
+                continue
+            for char, child in node.children.items():
+                # row[j] is the edit distance between word[:j] and prefix + char
+                next_row = [row[0] + 1]
+                for j in range(1, len(word) + 1):
+                    next_row.append(min(next_row[j - 1] + 1, row[j] + 1, row[j - 1] + (word[j - 1] != char)))
+                stack.append((child, prefix + char, next_row))
+        if k is None:
+            return sorted(matches, key=_rank)
+        return heapq.nsmallest(k, matches, key=_rank)
+
+    def iter_prefix(self, prefix, order = 'lex'):
+        """
+        Generator that lazily yields the (word, count) pairs of the words
+        with the given prefix, so that a caller can stop after one page.
+
+        - order='lex': alphabetical order, visiting children in sorted
+        order with an explicit stack
+        - order='count': the order of query, by decreasing count. This
+        is a best-first search in which a node is ranked by the count
+        at the head of its cache, the largest count in its subtree, so
+        a subtree is only opened once its best word is next in line.
+        Without caches the words are collected and sorted instead.
+        """
+        if order not in ('lex', 'count'):
+            raise ValueError("Order must be 'lex' or 'count'!")
+        node = self.root
+        for char in prefix:
+            if char not in node.children:
+                return
+            node = node.children[char]
+        if order == 'lex':
+            yield from self.__walk(node, prefix, None, None)
+        elif self.cache_size == 0:
+            yield from sorted(self.dfs(node, prefix[:-1]), key=_rank)
+        else:
+            # Entries are (-count, string, kind, node) where kind 0 is a word
+            # and kind 1 a subtree, whose count bounds every word in it
+            fringe = [(-node.top[0][1], prefix, 1, node)] if node.top else []
+            while fringe:
+                count, string, kind, node = heapq.heappop(fringe)
+                if kind == 0:
+                    yield (string, -count)
+                    continue
+                if node.is_end:
+                    heapq.heappush(fringe, (-node.counter, string, 0, None))
+                for char, child in node.children.items():
+                    if child.top:
+                        heapq.heappush(fringe, (-child.top[0][1], string + char, 1, child))
+
+    def items(self, start = None, stop = None):
+        """
+        Generator that yields the (word, count) pairs of the words w with
+        start <= w < stop in alphabetical order. Either bound can be None.
+        Subtrees whose prefix sorts entirely before start are skipped
+        without being visited, and the scan ends at the first word that
+        reaches stop.
+        """
+        return self.__walk(self.root, "", start, stop)
+
+    def __iter__(self):
+        """Generator that yields the words of the trie in alphabetical order"""
+        for word, count in self.__walk(self.root, "", None, None):
+            yield word
+
+    def __walk(self, node, prefix, start, stop):
+        """Helper generator for a lexicographic walk of the words below node, limited to [start, stop)"""
+        stack = [(node, prefix)]
+        while stack:
+            node, prefix = stack.pop()
+            if stop is not None and prefix >= stop:
+                # Every remaining word is at least prefix
+                return
+            if node.is_end and (start is None or prefix >= start):
+                yield (prefix, node.counter)
+            for char in sorted(node.children, reverse=True):
+                string = prefix + char
+                # Words below string are all smaller than start unless string is at least start's prefix
+                if start is None or string >= start[:len(string)]:
+                    stack.append((node.children[char], string))
 
     def __str__(self):
         """Method to return string representation of all words in trie"""
-        # Traverse the trie to get all candidates
-        self.output = []
-        self.dfs(self.root, "")
-        return '\n'.join(pair[0] for pair in sorted(self.output, key = lambda pair: pair[0]))
+        return '\n'.join(self)
+
+    def automaton(self):
+        """
+        Method to return an AhoCorasick automaton over the words currently
+        in the trie. The automaton is a snapshot, so it has to be rebuilt 
+        after words are inserted or deleted.
+        """
+        if self.minimized:
+            raise ValueError('Minimized trie shares nodes between words!')
+        return AhoCorasick(self)
+
+    def freeze(self):
+        """
+        Method to return a read-only FrozenTrie holding the words of the 
+        trie in flat integer arrays, which can be saved to a file and 
+        memory-mapped by any number of processes
+        """
+        return FrozenTrie.from_trie(self)
+
+    def memory_stats(self):
+        """
+        Method to return a dictionary with the number of nodes in the
+        trie and an estimate of the bytes they use, counting each node,
+        its attribute dictionary, its children dictionary, its character
+        and its cache of top words
+        """
+        nodes, size, stack = 0, 0, [self.root]
+        while stack:
+            node = stack.pop()
+            nodes += 1
+            size += sys.getsizeof(node) + sys.getsizeof(node.__dict__) + sys.getsizeof(node.children) + sys.getsizeof(node.char) + sys.getsizeof(node.top)
+            stack.extend(node.children.values())
+        return {'nodes': nodes, 'bytes': size}
 
     def delete(self, word):
         """
-        Method to delete word from trie if it exists
+        Method to delete one occurrence of word from trie if it exists.
+        Returns boolean indicating if anything was deleted.
 
-        1. Find word if it exists
-        2. If the node exists and it has children then 
-        we can't delete it and set the is_word flag to False
-        3. If the node has no children then we can delete it
-        and check if we can delete the parent
-        4. If the node has no children and its counter is 0
-        then delete it and check if we can delete its parent
+        1. Find word if it exists, recording the nodes on its path
+        2. Decrement the counter for this word, and if it reaches 0 
+        the node no longer ends a word
+        3. Walk back up the recorded path removing every node that 
+        neither ends a word nor has children, stopping at the first 
+        node that is still needed (or the root)
+        4. Recompute the caches of the nodes left on the path
         """
-        node, parent = self.root, None
+        if self.minimized:
+            raise ValueError('Minimized trie is read-only!')
+        if self.copy_on_write:
+            with self.batch():
+                return self.__delete(word)
+        return self.__delete(word)
+
+    def __delete(self, word):
+        """Helper method to delete one occurrence of word from the working trie"""
+        node = self.__working if self.copy_on_write else self.root
+        path = [node]
 
         # Find word in trie if it exists
         for char in word:
-            if char in node.children:
-                parent = node
-                node = parent.children[char]
-            else:
+            if char not in node.children:
                 # If character not in trie then word 
                 # does not exist and we return False 
                 # as we did not delete anything
                 return False
+            node = node.children[char]
+            path.append(node)
+        if not node.is_end:
+            return False
+
+        # Readers may be on the path so change copies of its nodes
+        fresh = self.__fresh
+        if fresh is not None:
+            for depth in range(1, len(path)):
+                if path[depth] not in fresh:
+                    path[depth] = self.__copy(path[depth])
+                    path[depth - 1].children[word[depth - 1]] = path[depth]
+            node = path[-1]
+
         # Decrement the counter for this word
-        print("Word on this recurse: {}, {}".format(word, node.children))
-        if node.is_end:
-            node.counter -= 1
-            if not node.children and node.counter == 0:
-                print("No children and counter == 0: {}".format(word))
-                node.is_end = False
-                node = None
-                del parent.children[word[-1]]
-                self.delete(word[:-1])
-        elif not node.children and not node.is_end:
-            print("Node has no children and it is not a word")
-            del parent.children[word[-1]]
-            node = None
-            self.delete(word[:-1])
-
-            
+        node.counter -= 1
+        if node.counter == 0:
+            node.is_end = False
+
+        # Prune nodes that no longer lead to any word
+        while len(path) > 1 and not path[-1].is_end and not path[-1].children:
+            del path[-2].children[path.pop().char]
+
+        self.__refresh_top(path, word)
+        return True
+
+class AhoCorasick:
+    """
+    Class representing an Aho-Corasick multi-pattern matcher built 
+    over the nodes of a Trie
+
+    Every node of the trie spells a string s. Its failure link points 
+    to the node spelling the longest proper suffix of s that is also 
+    in the trie, and its output link points to the nearest node along 
+    the failure links that ends a word. Both are computed with a 
+    breadth-first search, since the failure link of a node always 
+    points to a shallower node whose links are already known.
+
+    Scanning a text follows a child when one matches the next character
+    and failure links otherwise, so a text of length n is scanned in 
+    O(n + number of matches) however many words there are, instead of 
+    looking up every substring of the text.
+
+    Methods:
+        find_all(text): Returns every (start, word) occurrence in text
+        scan(chunks): Yields every (start, word) occurrence in a stream of text chunks
+        contains_any(text): Returns boolean indicating if any word occurs in text
+    """
+    def __init__(self, trie):
+        """Compute failure and output links over the nodes of the trie with a BFS"""
+        self.root = trie.root
+        self.fail = {self.root: self.root}
+        self.output = {}
+        self.words = {}
+        if self.root.is_end and self.root.counter > 0:
+            self.words[self.root] = ""
+        q = deque([(self.root, "")])
+        while q:
+            node, prefix = q.popleft()
+            for char, child in node.children.items():
+                word = prefix + char
+                if child.is_end and child.counter > 0:
+                    self.words[child] = word
+                # Longest proper suffix of word in the trie extends that of prefix
+                f = self.fail[node]
+                while char not in f.children and f is not self.root:
+                    f = self.fail[f]
+                f = f.children.get(char, self.root)
+                self.fail[child] = self.root if f is child else f
+                # Nearest word ending along the failure links
+                f = self.fail[child]
+                self.output[child] = f if f in self.words else self.output.get(f)
+                q.append((child, word))
+
+    def find_all(self, text):
+        """Method to return a list of (start index, word) for every occurrence of every word in text"""
+        return list(self.scan([text]))
+
+    def contains_any(self, text):
+        """Method to return boolean indicating if any word of the trie occurs in text"""
+        for match in self.scan([text]):
+            return True
+        return False
+
+    def scan(self, chunks):
+        """
+        Generator that yields (start index, word) for every occurrence of 
+        every word in the concatenation of chunks, in order of where the 
+        occurrences end. The automaton state is carried from one chunk 
+        to the next, so occurrences spanning chunk boundaries are found 
+        and the text never has to be held in memory at once.
+        """
+        node, position = self.root, 0
+        if self.root in self.words:
+            yield (0, "")
+        for chunk in chunks:
+            for char in chunk:
+                while char not in node.children and node is not self.root:
+                    node = self.fail[node]
+                node = node.children.get(char, self.root)
+                position += 1
+                match = node if node in self.words else self.output.get(node)
+                while match is not None:
+                    word = self.words[match]
+                    yield (position - len(word), word)
+                    match = self.output.get(match)
+
+class FrozenTrie:
+    """
+    Class representing a read-only Trie stored in flat integer arrays
+
+    Nodes are numbered in level order (breadth-first, children in 
+    sorted order), which places the children of every node next to 
+    each other. Three arrays then describe the whole trie, in the 
+    spirit of a LOUDS succinct trie:
+
+        - labels[i]: the code point of the character of node i
+        - first_child[i]: the number of the first child of node i, so 
+        that its children are first_child[i], ..., first_child[i + 1] - 1
+        - counts[i]: how many times the word ending at node i was 
+        inserted, 0 if no word ends there
+
+    That is 12 bytes per node instead of a Python object with a 
+    dictionary. Following a character is a binary search over the 
+    labels of the children. save writes the arrays to a file and load 
+    memory-maps it, so processes that load the same file share one 
+    copy in the page cache instead of each rebuilding a Trie.
+
+    Methods:
+        search(word): Returns boolean indicating if word is in the trie
+        query(x, k): Given a prefix, return the k most frequent (or all) words starting with that prefix
+        save(path): Writes the arrays to a file
+        load(path): Memory-maps a file written by save
+    """
+    MAGIC = b'FTRIE\x00\x00\x01'
+    HEADER = struct.Struct('=8sQ')
+
+    def __init__(self, labels, first_child, counts, mapped = None):
+        self.labels = labels
+        self.first_child = first_child
+        self.counts = counts
+        self.__mapped = mapped
+
+    @classmethod
+    def from_trie(cls, trie):
+        """Method to build a FrozenTrie from the nodes of a Trie with a BFS"""
+        labels, first_child, counts = array('I', [0]), array('I'), array('I')
+        q = deque([trie.root])
+        while q:
+            node = q.popleft()
+            first_child.append(len(labels))
+            counts.append(node.counter if node.is_end else 0)
+            for char in sorted(node.children):
+                labels.append(ord(char))
+                q.append(node.children[char])
+        first_child.append(len(labels))
+        return cls(labels, first_child, counts)
+
+    def __len__(self):
+        """Method to return the number of distinct words in the trie"""
+        return sum(1 for count in self.counts if count)
+
+    def search(self, word):
+        """Method to return boolean indicating if word exists in trie"""
+        node = self.__find(word)
+        return node is not None and self.counts[node] > 0
+
+    def query(self, x, k = None):
+        """
+        Given an input (a prefix), retrieve all words stored in the 
+        trie with that prefix, sorted by the number of times they 
+        have been inserted, or only the k most frequent of them
+        """
+        node = self.__find(x)
+        if node is None:
+            return []
+        matches, stack = [], [(node, x)]
+        while stack:
+            node, prefix = stack.pop()
+            if self.counts[node]:
+                matches.append((prefix, self.counts[node]))
+            for child in range(self.first_child[node], self.first_child[node + 1]):
+                stack.append((child, prefix + chr(self.labels[child])))
+        if k is None:
+            return sorted(matches, key=_rank)
+        return heapq.nsmallest(k, matches, key=_rank)
+
+    def save(self, path):
+        """Method to write the arrays of the trie to a file"""
+        with open(path, 'wb') as f:
+            f.write(self.HEADER.pack(self.MAGIC, len(self.labels)))
+            f.write(self.labels)
+            f.write(self.first_child)
+            f.write(self.counts)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Method to memory-map a file written by save. The arrays are 
+        views into the mapping, so nothing is copied and the pages are 
+        shared with every other process that maps the same file.
+        """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n = cls.HEADER.unpack_from(mapped)
+        if magic != cls.MAGIC:
+            mapped.close()
+            raise ValueError('Not a frozen trie file!')
+        view, offset = memoryview(mapped), cls.HEADER.size
+        labels = view[offset:offset + 4 * n].cast('I')
+        offset += 4 * n
+        first_child = view[offset:offset + 4 * (n + 1)].cast('I')
+        offset += 4 * (n + 1)
+        counts = view[offset:offset + 4 * n].cast('I')
+        return cls(labels, first_child, counts, mapped)
+
+    def close(self):
+        """Method to release the memory mapping of a trie returned by load"""
+        if self.__mapped is not None:
+            self.labels.release()
+            self.first_child.release()
+            self.counts.release()
+            self.__mapped.close()
+            self.__mapped = None
+
+    def __find(self, word):
+        """Helper method to return the number of the node spelling word, or None"""
+        node = 0
+        for char in word:
+            code = ord(char)
+            lo, hi = self.first_child[node], self.first_child[node + 1]
+            i = bisect_left(self.labels, code, lo, hi)
+            if i == hi or self.labels[i] != code:
+                return None
+            node = i
+        return node
+
 t = Trie()
 t.insert('was')
 t.insert('word')
@@ -0,0 +1,113 @@
+import random
+import unittest
+from collections import Counter
+from Trie import Trie
+
+def levenshtein(a, b):
+    # edit distance between a and b, one row of the table at a time
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        previous, row = row, [i]
+        for j in range(1, len(b) + 1):
+            row.append(min(row[j - 1] + 1, previous[j] + 1, previous[j - 1] + (a[i - 1] != b[j - 1])))
+    return row[-1]
+
+def ranked(counts):
+    # (word, count) pairs by decreasing count, then alphabetically
+    return sorted(counts.items(), key=lambda pair: (-pair[1], pair[0]))
+
+def state(node):
+    # every field of every node reachable from node, to detect changes
+    nodes, stack = [], [node]
+    while stack:
+        node = stack.pop()
+        nodes.append((id(node), node.char, node.is_end, node.counter, sorted(node.children.items()), list(node.top)))
+        stack.extend(node.children.values())
+    return sorted(nodes, key=lambda entry: entry[0])
+
+class TestTrie(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        print('Setting up TestTrie test suite')
+
+    @classmethod
+    def tearDownClass(cls):
+        print('')
+        print('Tearing down TestTrie test suite')
+
+    def setUp(self):
+        random.seed(44)
+        # short words over a small alphabet share many prefixes and counts
+        self.words = [''.join(random.choice('abcd') for _ in range(random.randint(1, 5))) for _ in range(3000)]
+        self.counts = Counter(self.words)
+
+    def build(self, copy_on_write = False):
+        t = Trie(cache_size=5, copy_on_write=copy_on_write)
+        for word in self.words:
+            t.insert(word)
+        return t
+
+    def test_top_k(self):
+        t = self.build()
+        # remove some words so that caches are refreshed after counts go down
+        for word in self.words[:1000]:
+            self.assertTrue(t.delete(word))
+            self.counts[word] -= 1
+        self.counts = +self.counts
+        self.assertFalse(t.delete('e'))
+        for prefix in ('', 'a', 'ab', 'dcb', 'abcd', 'ddddd', 'e'):
+            expected = ranked(Counter({w: c for w, c in self.counts.items() if w.startswith(prefix)}))
+            # Case: k within the cache, beyond the cache, and all words
+            for k in (1, 3, 5, 8, None):
+                self.assertEqual(t.query(prefix, k), expected[:k])
+
+    def test_fuzzy_query(self):
+        t = self.build()
+        for word in ('', 'a', 'abc', 'dddd', 'badca', 'xyz'):
+            for max_edits in (0, 1, 2):
+                expected = ranked(Counter({w: c for w, c in self.counts.items() if levenshtein(word, w) <= max_edits}))
+                self.assertEqual(t.fuzzy_query(word, max_edits), expected)
+                self.assertEqual(t.fuzzy_query(word, max_edits, 4), expected[:4])
+
+    def test_snapshots(self):
+        t = self.build(copy_on_write=True)
+        root = t.root
+        before = state(root)
+        published = t.query('', None)
+        # Case: Later batches never change a published snapshot
+        with t.batch():
+            for word in self.words[:500]:
+                t.insert(word + 'a')
+                t.delete(word)
+            # Case: Writes inside a batch are not visible until it exits
+            self.assertIs(t.root, root)
+        self.assertIsNot(t.root, root)
+        self.assertEqual(state(root), before)
+        self.assertEqual(sorted(t.dfs(root, '')), sorted(published))
+        t.insert('abcdab')
+        t.delete('a')
+        self.assertEqual(state(root), before)
+        self.assertTrue(t.search('abcdab'))
+
+    def test_failed_batch(self):
+        t = self.build(copy_on_write=True)
+        root = t.root
+        before = state(root)
+        # Case: A batch that raises is not published
+        with self.assertRaises(KeyError):
+            with t.batch():
+                t.insert('newword')
+                t.delete(self.words[0])
+                raise KeyError('abort')
+        self.assertIs(t.root, root)
+        self.assertEqual(state(root), before)
+        self.assertFalse(t.search('newword'))
+        # Case: The next batch starts from the published version
+        with t.batch():
+            t.insert('other')
+        self.assertTrue(t.search('other'))
+        self.assertFalse(t.search('newword'))
+        self.assertRaises(ValueError, Trie().batch().__enter__)
+
+if __name__ == '__main__':
+    unittest.main()